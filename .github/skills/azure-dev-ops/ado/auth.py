@@ -10,11 +10,13 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Optional
 
-from azure.identity import AzureCliCredential, DefaultAzureCredential
+# azure.identity (msal, cryptography, …) is imported only when a token has
+# to be minted; cache hits never load it.
 
 # ADO REST API resource scope
 _ADO_RESOURCE = "499b84ac-1321-427f-aa17-267ca6975798/.default"
@@ -25,16 +27,18 @@ _CACHE_FILE = _CACHE_DIR / "token_cache.json"
 
 # In-memory singleton
 _cached_token: Optional[dict] = None
+# Serialises refreshes so concurrent downloads don't each spawn `az`
+_token_lock = threading.Lock()
 
 
 def _load_cache() -> Optional[dict]:
     """Load cached token from disk if still valid."""
     try:
-        if _CACHE_FILE.exists():
-            data = json.loads(_CACHE_FILE.read_text())
-            # Keep a 5-minute buffer before expiry
-            if data.get("expires_on", 0) > time.time() + 300:
-                return data
+        # A missing file raises here too; no separate exists() check needed
+        data = json.loads(_CACHE_FILE.read_bytes())
+        # Keep a 5-minute buffer before expiry
+        if data.get("expires_on", 0) > time.time() + 300:
+            return data
     except Exception:
         pass
     return None
@@ -59,9 +63,19 @@ def get_token() -> str:
     3. AzureCliCredential (az login)
     4. DefaultAzureCredential (managed identity, etc.)
     """
+    # 1. In-memory cache
+    if _cached_token and _cached_token["expires_on"] > time.time() + 300:
+        return _cached_token["token"]
+
+    with _token_lock:
+        return _refresh_token()
+
+
+def _refresh_token() -> str:
+    """Resolve a token from disk or credentials.  Caller holds ``_token_lock``."""
     global _cached_token
 
-    # 1. In-memory cache
+    # Another thread may have refreshed while we waited for the lock
     if _cached_token and _cached_token["expires_on"] > time.time() + 300:
         return _cached_token["token"]
 
@@ -71,6 +85,8 @@ def get_token() -> str:
         _cached_token = disk
         return disk["token"]
 
+    from azure.identity import AzureCliCredential, DefaultAzureCredential
+
     # 3. AzureCliCredential first (fast when user has done `az login`)
     for cred_cls in (AzureCliCredential, DefaultAzureCredential):
         try:
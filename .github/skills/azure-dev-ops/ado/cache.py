@@ -0,0 +1,120 @@
+"""
+On-disk cache for immutable Azure DevOps responses.
+
+Mostly responses that can never change are cached — a commit by SHA, file
+content at a commit, a work item as of a date, a PR iteration's changes —
+so entries never need invalidation.  (Completed builds are not: re-running
+failed jobs reopens the same build.)  Slow-changing lookups (identities) are
+cached too and read back with a ``max_age``.  Streamed bodies (file
+downloads) are stored as raw ``.bin`` entries.  Set ``ADO_SKILL_NO_CACHE=1``
+to bypass.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional
+
+# Shares the auth token cache root
+_CACHE_DIR = Path(os.environ.get("ADO_SKILL_CACHE_DIR", Path.home() / ".cache" / "ado-skill")) / "responses"
+
+# Sentinel returned by load() on a cache miss (None is a valid response)
+MISS = object()
+
+
+def _enabled() -> bool:
+    return os.environ.get("ADO_SKILL_NO_CACHE", "").lower() not in ("1", "true", "yes")
+
+
+def _entry_path(kind: str, url: str, params: Optional[Dict[str, Any]], suffix: str = ".json") -> Path:
+    key = json.dumps([kind, url, sorted((params or {}).items())], default=str)
+    return _CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}{suffix}"
+
+
+def load(kind: str, url: str, params: Optional[Dict[str, Any]], *, max_age: Optional[float] = None) -> Any:
+    """Return the cached response for this request, or ``MISS``.
+
+    Entries older than ``max_age`` seconds count as a miss.
+    """
+    if not _enabled():
+        return MISS
+    path = _entry_path(kind, url, params)
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return MISS
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["data"]
+    except Exception:
+        return MISS
+
+
+def store(kind: str, url: str, params: Optional[Dict[str, Any]], data: Any) -> None:
+    """Persist a response.  Writes are atomic so concurrent readers never see partial files."""
+    if not _enabled():
+        return
+    tmp: Optional[str] = None
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"data": data}, f)
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, _entry_path(kind, url, params))
+    except Exception:
+        if tmp and os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def open_bytes(url: str, params: Optional[Dict[str, Any]]) -> Optional[BinaryIO]:
+    """Open a cached raw body for reading, or return None on a miss."""
+    if not _enabled():
+        return None
+    try:
+        return open(_entry_path("bytes", url, params, ".bin"), "rb")
+    except OSError:
+        return None
+
+
+def store_stream(url: str, params: Optional[Dict[str, Any]], chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield ``chunks`` while copying them into the cache.
+
+    The entry is published only once the body has been read to the end;
+    an abandoned or failed stream leaves no entry behind.  Cache write
+    errors never interrupt the stream.
+    """
+    f: Optional[BinaryIO] = None
+    tmp: Optional[str] = None
+    if _enabled():
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+            f = os.fdopen(fd, "wb")
+        except Exception:
+            f = None
+    try:
+        for chunk in chunks:
+            if f is not None:
+                try:
+                    f.write(chunk)
+                except Exception:
+                    f.close()
+                    f = None
+            yield chunk
+        if f is not None and tmp is not None:
+            try:
+                done, f = f, None
+                done.close()
+                os.chmod(tmp, 0o600)
+                os.replace(tmp, _entry_path("bytes", url, params, ".bin"))
+            except Exception:
+                pass  # the finally block removes the temp file
+    finally:
+        if f is not None:
+            f.close()
+        if tmp and os.path.exists(tmp):
+            os.unlink(tmp)
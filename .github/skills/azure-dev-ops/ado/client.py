@@ -7,15 +7,28 @@ base URL construction, pagination, and error reporting.
 
 from __future__ import annotations
 
+import contextvars
 import json
+import random
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from . import auth
+from . import auth, cache
+
+try:  # optional: faster JSON encoding for large outputs
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -26,23 +39,113 @@ _DEFAULT_TIMEOUT = 60  # seconds
 _SEARCH_TIMEOUT = 120  # search endpoints are notoriously slow
 _MAX_RETRIES = 2
 _RETRY_BACKOFF = 2  # seconds, doubles each retry
+_RETRY_JITTER = 0.5  # back-off is stretched by a random 0–50%
+_MAX_RETRY_AFTER = 60  # seconds, cap on a server-requested Retry-After
+_POOL_CONNECTIONS = 16  # distinct hosts kept alive (dev, almsearch, vssps, …)
+_POOL_MAXSIZE = 32  # connections per host, bounds concurrent downloads
+_STREAM_CHUNK_SIZE = 64 * 1024  # bytes per chunk for streamed downloads
+_MAX_JSON_BYTES = 50 * 1024 * 1024  # refuse to decode larger JSON bodies
 
 _org_url: str | None = None
+# Per-context override set by org_scope(); wins over set_org()
+_scoped_org_url: contextvars.ContextVar[str | None] = contextvars.ContextVar("ado_org_url", default=None)
+# Set by stream_lists(): get_all hands back iter_all's generator unconsumed
+_lazy_lists: contextvars.ContextVar[bool] = contextvars.ContextVar("ado_lazy_lists", default=False)
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def _org_url_for(org: str) -> str:
+    if org.startswith("https://"):
+        return org.rstrip("/")
+    return f"https://dev.azure.com/{org}"
 
 
 def set_org(org: str) -> None:
     """Set the ADO organization. Called once from CLI before any request."""
     global _org_url
-    if org.startswith("https://"):
-        _org_url = org.rstrip("/")
-    else:
-        _org_url = f"https://dev.azure.com/{org}"
+    _org_url = _org_url_for(org)
+
+
+@contextmanager
+def org_scope(org: str) -> Iterator[None]:
+    """Target ``org`` for requests made in this context (thread or task).
+
+    Lets library callers query several organizations concurrently; the
+    session and token are shared since both are organization-independent.
+    ``gather`` and the bulk downloader carry the scope into their workers.
+    """
+    token = _scoped_org_url.set(_org_url_for(org))
+    try:
+        yield
+    finally:
+        _scoped_org_url.reset(token)
+
+
+@contextmanager
+def stream_lists() -> Iterator[None]:
+    """Make ``get_all`` calls in this context return a lazy iterator.
+
+    The CLI wraps ``--ndjson`` list commands in this, so items are written
+    while later pages are still downloading.  Only wrap functions that
+    return ``get_all``'s result unchanged.
+    """
+    token = _lazy_lists.set(True)
+    try:
+        yield
+    finally:
+        _lazy_lists.reset(token)
 
 
 def _org() -> str:
-    if not _org_url:
+    org_url = _scoped_org_url.get() or _org_url
+    if not org_url:
         raise RuntimeError("Organization not set. Pass --org to the CLI.")
-    return _org_url
+    return org_url
+
+
+# ---------------------------------------------------------------------------
+# HTTP session
+# ---------------------------------------------------------------------------
+
+
+def _get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use.
+
+    Reusing one session keeps TCP/TLS connections alive across requests,
+    so multi-call commands (bulk downloads, PR summaries) only pay the
+    handshake once per host.  Retries stay in ``_request_with_retry``.
+
+    Compression needs no setup: requests advertises ``gzip, deflate`` (plus
+    ``br`` / ``zstd`` when urllib3 finds those decoders installed) and
+    decodes bodies transparently, including streamed ones.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared session and release pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+@contextmanager
+def session_scope() -> Iterator[requests.Session]:
+    """Context manager that closes the shared session on exit."""
+    try:
+        yield _get_session()
+    finally:
+        close_session()
 
 
 # ---------------------------------------------------------------------------
@@ -87,6 +190,36 @@ def _timeout_for_area(area: str) -> int:
     return _DEFAULT_TIMEOUT
 
 
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_wait(resp: Optional[requests.Response], attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt + 1``.
+
+    The exponential back-off is jittered so parallel workers that failed
+    together do not retry in lock-step.  A ``Retry-After`` header (sent by
+    Azure DevOps when throttling) is honoured, never waiting less than the
+    back-off.
+    """
+    wait = _RETRY_BACKOFF * (2 ** attempt) * random.uniform(1, 1 + _RETRY_JITTER)
+    headers = getattr(resp, "headers", None) or {}
+    retry_after = _retry_after_seconds(headers.get("Retry-After"))
+    if retry_after is None:
+        return wait
+    return max(wait, min(retry_after, _MAX_RETRY_AFTER))
+
+
 def _request_with_retry(
     method: str,
     url: str,
@@ -95,33 +228,68 @@ def _request_with_retry(
     params: Optional[Dict[str, Any]] = None,
     json_body: Optional[Any] = None,
     timeout: int = _DEFAULT_TIMEOUT,
+    stream: bool = False,
 ) -> requests.Response:
     """Issue an HTTP request with automatic retry on transient failures."""
     last_exc: Optional[Exception] = None
+    session = _get_session()
     for attempt in range(_MAX_RETRIES + 1):
         try:
             if method == "GET":
-                resp = requests.get(url, headers=headers, params=params, timeout=timeout)
+                resp = session.get(url, headers=headers, params=params, timeout=timeout, stream=stream)
             else:
-                resp = requests.post(url, headers=headers, params=params, json=json_body, timeout=timeout)
+                resp = session.post(url, headers=headers, params=params, json=json_body, timeout=timeout)
             if resp.status_code in (429, 500, 502, 503, 504) and attempt < _MAX_RETRIES:
-                wait = _RETRY_BACKOFF * (2 ** attempt)
-                print(f"[retry] HTTP {resp.status_code} on {method} {url}, waiting {wait}s (attempt {attempt + 1}/{_MAX_RETRIES + 1})", file=sys.stderr)
+                wait = retry_wait(resp, attempt)
+                # Return the (possibly streamed) connection to the pool while we wait
+                resp.close()
+                print(f"[retry] HTTP {resp.status_code} on {method} {url}, waiting {wait:.1f}s (attempt {attempt + 1}/{_MAX_RETRIES + 1})", file=sys.stderr)
                 time.sleep(wait)
                 continue
-            resp.raise_for_status()
+            if resp.status_code >= 400:
+                # Hand a streamed connection back to the pool before raising
+                resp.close()
+                resp.raise_for_status()
             return resp
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as exc:
             last_exc = exc
             if attempt < _MAX_RETRIES:
-                wait = _RETRY_BACKOFF * (2 ** attempt)
-                print(f"[retry] {type(exc).__name__} on {method} {url}, waiting {wait}s (attempt {attempt + 1}/{_MAX_RETRIES + 1})", file=sys.stderr)
+                wait = retry_wait(None, attempt)
+                print(f"[retry] {type(exc).__name__} on {method} {url}, waiting {wait:.1f}s (attempt {attempt + 1}/{_MAX_RETRIES + 1})", file=sys.stderr)
                 time.sleep(wait)
             else:
                 raise
     raise last_exc  # should not reach here, but satisfy type checker
 
 
+def _json_body(resp: requests.Response) -> Any:
+    """Decode a JSON response body (orjson when available).
+
+    Bodies larger than ``_MAX_JSON_BYTES`` are refused before parsing: as
+    Python objects they would take several times that in memory.  The
+    limit applies to the decompressed body.  ``Content-Length`` (the size
+    on the wire, compressed or not) only lets an obviously oversized
+    response be refused before it is read.
+    """
+    size = resp.headers.get("Content-Length")
+    if size and size.isdigit() and int(size) > _MAX_JSON_BYTES:
+        resp.close()
+        raise _too_large(resp, int(size))
+    content = resp.content
+    if len(content) > _MAX_JSON_BYTES:
+        raise _too_large(resp, len(content))
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _too_large(resp: requests.Response, size: int) -> RuntimeError:
+    return RuntimeError(
+        f"Response too large ({size // (1024 * 1024)} MiB) from {resp.url}. "
+        "Narrow the query (e.g. --top or filters)."
+    )
+
+
 def get(
     path: str,
     *,
@@ -129,17 +297,30 @@ def get(
     params: Optional[Dict[str, Any]] = None,
     api_version: str = _DEFAULT_API_VERSION,
     area: str = "dev.azure.com",
+    immutable: bool = False,
+    ttl: Optional[int] = None,
 ) -> Any:
-    """Issue an authenticated GET and return the JSON body."""
+    """Issue an authenticated GET and return the JSON body.
+
+    Pass ``immutable`` for resources that can never change to serve
+    repeat requests from the on-disk cache (see ``ado.cache``); pass
+    ``ttl`` (seconds) for resources that change rarely.
+    """
     url = _build_url(path, project=project, area=area)
     p: Dict[str, Any] = {"api-version": api_version}
     if params:
         p.update(params)
-    resp = _request_with_retry("GET", url, headers=_headers(), params=p, timeout=_timeout_for_area(area))
+    if immutable or ttl:
+        hit = cache.load("json", url, p, max_age=None if immutable else ttl)
+        if hit is not cache.MISS:
+            return hit
+    # Streamed so _json_body can refuse an oversized body before reading it
+    resp = _request_with_retry("GET", url, headers=_headers(), params=p, timeout=_timeout_for_area(area), stream=True)
     content_type = resp.headers.get("Content-Type", "")
-    if "application/json" in content_type:
-        return resp.json()
-    return resp.text
+    data = _json_body(resp) if "application/json" in content_type else resp.text
+    if immutable or ttl:
+        cache.store("json", url, p, data)
+    return data
 
 
 def post(
@@ -161,7 +342,7 @@ def post(
     resp = _request_with_retry("POST", url, headers=hdrs, params=p, json_body=json_body, timeout=_timeout_for_area(area))
     content_type = resp.headers.get("Content-Type", "")
     if "application/json" in content_type:
-        return resp.json()
+        return _json_body(resp)
     return resp.text
 
 
@@ -172,41 +353,196 @@ def get_text(
     params: Optional[Dict[str, Any]] = None,
     api_version: str = _DEFAULT_API_VERSION,
     area: str = "dev.azure.com",
+    immutable: bool = False,
 ) -> str:
     """Issue an authenticated GET expecting a plain-text response."""
     url = _build_url(path, project=project, area=area)
     p: Dict[str, Any] = {"api-version": api_version}
     if params:
         p.update(params)
+    if immutable:
+        hit = cache.load("text", url, p)
+        if hit is not cache.MISS:
+            return hit
     hdrs = _headers()
     hdrs["Accept"] = "text/plain"
     resp = _request_with_retry("GET", url, headers=hdrs, params=p, timeout=_timeout_for_area(area))
+    if immutable:
+        cache.store("text", url, p, resp.text)
     return resp.text
 
 
+def get_stream(
+    path: str,
+    *,
+    project: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    api_version: str = _DEFAULT_API_VERSION,
+    area: str = "dev.azure.com",
+    immutable: bool = False,
+) -> Iterator[bytes]:
+    """Issue an authenticated GET and return the body as an iterator of byte chunks.
+
+    The request (and any HTTP error) happens immediately; the body is read
+    lazily so large downloads (build logs, files) use constant memory.
+    With ``immutable`` the raw bytes are cached on disk as they stream.
+    """
+    url = _build_url(path, project=project, area=area)
+    p: Dict[str, Any] = {"api-version": api_version}
+    if params:
+        p.update(params)
+    if immutable:
+        cached = cache.open_bytes(url, p)
+        if cached is not None:
+            return _file_chunks(cached)
+    hdrs = _headers()
+    hdrs["Accept"] = "text/plain"
+    resp = _request_with_retry("GET", url, headers=hdrs, params=p, timeout=_timeout_for_area(area), stream=True)
+
+    def _chunks() -> Iterator[bytes]:
+        try:
+            yield from resp.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+        finally:
+            resp.close()
+
+    return cache.store_stream(url, p, _chunks()) if immutable else _chunks()
+
+
+def _file_chunks(f: Any) -> Iterator[bytes]:
+    with f:
+        while chunk := f.read(_STREAM_CHUNK_SIZE):
+            yield chunk
+
+
+def _get_page(
+    path: str, project: Optional[str], params: Dict[str, Any], api_version: str, area: str,
+    json_body: Optional[Dict[str, Any]] = None,
+) -> tuple[Any, Optional[str]]:
+    """Fetch one page; return (body, continuation token or None).
+
+    A ``json_body`` makes the request a POST.  The token comes from the
+    body or, for most list endpoints, from the ``x-ms-continuationtoken``
+    response header.
+    """
+    url = _build_url(path, project=project, area=area)
+    p: Dict[str, Any] = {"api-version": api_version, **params}
+    timeout = _timeout_for_area(area)
+    if json_body is None:
+        resp = _request_with_retry("GET", url, headers=_headers(), params=p, timeout=timeout, stream=True)
+    else:
+        hdrs = _headers()
+        hdrs["Content-Type"] = "application/json"
+        resp = _request_with_retry("POST", url, headers=hdrs, params=p, json_body=json_body, timeout=timeout)
+    if "application/json" not in resp.headers.get("Content-Type", ""):
+        return resp.text, None
+    data = _json_body(resp)
+    ct = data.get("continuationToken") if isinstance(data, dict) else None
+    return data, ct or resp.headers.get("x-ms-continuationtoken")
+
+
+def iter_all(
+    path: str,
+    *,
+    project: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    json_body: Optional[Dict[str, Any]] = None,
+    api_version: str = _DEFAULT_API_VERSION,
+    area: str = "dev.azure.com",
+    max_pages: int = 20,
+    limit: Optional[int] = None,
+) -> Iterator[Any]:
+    """Yield items from a continuation-token–paginated list as pages arrive.
+
+    The next page is requested in the background as soon as its token is
+    known, so it downloads while the caller consumes the current one.
+    ``limit`` stops paging once that many items have been yielded (pass
+    the caller's ``$top``; the server may still hand back a continuation
+    token after a full page).  Pass ``json_body`` for list endpoints that
+    are POSTs (e.g. wiki ``pagesbatch``); the token then goes in the body.
+    """
+    p = dict(params or {})
+    body = dict(json_body) if json_body is not None else None
+    count = 0
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        data, ct = _get_page(path, project, dict(p), api_version, area, dict(body) if body is not None else None)
+        for page in range(max_pages):
+            if not isinstance(data, dict):
+                return
+            items = data.get("value", [])
+            more = bool(ct) and page + 1 < max_pages and (limit is None or count + len(items) < limit)
+            if more:
+                if body is None:
+                    p["continuationToken"] = ct
+                else:
+                    body["continuationToken"] = ct
+                pending = pool.submit(
+                    contextvars.copy_context().run, _get_page, path, project, dict(p), api_version, area,
+                    dict(body) if body is not None else None,
+                )
+            for item in items:
+                if limit is not None and count >= limit:
+                    return
+                yield item
+                count += 1
+            if not more:
+                return
+            data, ct = pending.result()
+
+
 def get_all(
     path: str,
     *,
     project: Optional[str] = None,
     params: Optional[Dict[str, Any]] = None,
+    json_body: Optional[Dict[str, Any]] = None,
     api_version: str = _DEFAULT_API_VERSION,
     area: str = "dev.azure.com",
     max_pages: int = 20,
+    limit: Optional[int] = None,
 ) -> List[Any]:
-    """GET with continuation-token–based pagination.  Returns all items."""
-    all_items: List[Any] = []
-    p = dict(params or {})
-    for _ in range(max_pages):
-        data = get(path, project=project, params=p, api_version=api_version, area=area)
-        if isinstance(data, dict):
-            all_items.extend(data.get("value", []))
-            ct = data.get("continuationToken") or data.get("x-ms-continuationtoken")
-            if not ct:
-                break
-            p["continuationToken"] = ct
-        else:
-            break
-    return all_items
+    """GET (or POST, with ``json_body``) with continuation-token–based pagination.  Returns all items.
+
+    Inside ``stream_lists()`` the ``iter_all`` generator is returned as is.
+    """
+    items = iter_all(
+        path, project=project, params=params, json_body=json_body, api_version=api_version,
+        area=area, max_pages=max_pages, limit=limit,
+    )
+    return items if _lazy_lists.get() else list(items)
+
+
+# ---------------------------------------------------------------------------
+# Concurrency helper
+# ---------------------------------------------------------------------------
+
+
+def _settled(call: Callable[[], Any]) -> Any:
+    """Run ``call``; turn a failure into an ``{"error": ...}`` result."""
+    try:
+        return call()
+    except Exception as exc:  # noqa: BLE001
+        return {"error": f"{type(exc).__name__}: {exc}"}
+
+
+def gather(
+    *calls: Callable[[], Any], max_workers: Optional[int] = None, return_errors: bool = False
+) -> List[Any]:
+    """Run independent request callables concurrently; return results in order.
+
+    All calls share the pooled session and run in a copy of the caller's
+    context (so ``org_scope`` applies).  At most ``max_workers`` (and never
+    more than ``_POOL_MAXSIZE``) run at once.  The first exception raised
+    by any call is re-raised once every call has finished, unless
+    ``return_errors`` is set: then each failed call yields an
+    ``{"error": ...}`` dict in its slot and the others still return.
+    """
+    if return_errors:
+        calls = tuple(partial(_settled, call) for call in calls)
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(len(calls), max_workers or _POOL_MAXSIZE, _POOL_MAXSIZE)) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, call) for call in calls]
+    return [f.result() for f in futures]
 
 
 # ---------------------------------------------------------------------------
@@ -215,6 +551,7 @@ def get_all(
 
 
 _output_file: str | None = None
+_ndjson = False
 
 
 def set_output_file(path: str | None) -> None:
@@ -223,18 +560,63 @@ def set_output_file(path: str | None) -> None:
     _output_file = path
 
 
+def set_ndjson(enabled: bool) -> None:
+    """Emit one compact JSON document per line (one per list item)."""
+    global _ndjson
+    _ndjson = enabled
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Serialise ``data`` as indented UTF-8 JSON (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(data, indent=2, default=str, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _ndjson_line(item: Any) -> bytes:
+    """Serialise one item as a compact JSON line (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(item, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(item, default=str, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _ndjson_bytes(data: Any) -> bytes:
+    """Serialise a list as newline-delimited compact JSON (other values as one line)."""
+    items = data if isinstance(data, list) else [data]
+    return b"".join(map(_ndjson_line, items))
+
+
+def iter_ndjson(items: Iterable[Any]) -> Iterator[bytes]:
+    """Yield one NDJSON line per item, for ``output_stream``."""
+    return map(_ndjson_line, items)
+
+
+def _write_stdout(payload: bytes) -> None:
+    """Write bytes to stdout, skipping the text layer when possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # e.g. stdout replaced by a StringIO
+        sys.stdout.write(payload.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(payload)
+    buffer.flush()
+
+
 def output(data: Any) -> None:
-    """Pretty-print JSON to stdout or to the configured output file."""
+    """Pretty-print JSON (or NDJSON) to stdout or to the configured output file."""
+    payload = _ndjson_bytes(data) if _ndjson else _json_bytes(data)
     if _output_file:
         import pathlib
         pathlib.Path(_output_file).parent.mkdir(parents=True, exist_ok=True)
-        with open(_output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
-            f.write("\n")
+        with open(_output_file, "wb") as f:
+            f.write(payload)
         print(f"Output written to {_output_file}")
     else:
-        json.dump(data, sys.stdout, indent=2, default=str)
-        print()
+        _write_stdout(payload)
 
 
 def output_text(text: str) -> None:
@@ -246,4 +628,23 @@ def output_text(text: str) -> None:
             f.write(text)
         print(f"Output written to {_output_file}")
     else:
-        print(text)
+        _write_stdout((text + "\n").encode("utf-8"))
+
+
+def output_stream(chunks: Iterable[bytes]) -> None:
+    """Copy byte chunks to stdout or to the configured output file as they arrive."""
+    if _output_file:
+        import pathlib
+        pathlib.Path(_output_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(_output_file, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        print(f"Output written to {_output_file}")
+        return
+    last = b"\n"
+    for chunk in chunks:
+        if chunk:
+            _write_stdout(chunk)
+            last = chunk
+    if not last.endswith(b"\n"):
+        _write_stdout(b"\n")
@@ -6,6 +6,8 @@ from typing import Any, Dict, List, Optional
 
 from . import client
 
+_IDENTITY_TTL = 3600  # seconds an identity lookup is served from the disk cache
+
 
 def list_projects(
     *,
@@ -24,7 +26,7 @@ def list_projects(
         params["stateFilter"] = state_filter
     if name_filter:
         params["projectNameFilter"] = name_filter
-    return client.get_all("_apis/projects", params=params)
+    return client.get_all("_apis/projects", params=params, limit=top)
 
 
 def list_project_teams(
@@ -42,7 +44,7 @@ def list_project_teams(
         params["$skip"] = skip
     if mine is not None:
         params["$mine"] = str(mine).lower()
-    return client.get_all(f"_apis/projects/{project}/teams", params=params)
+    return client.get_all(f"_apis/projects/{project}/teams", params=params, limit=top)
 
 
 def get_identity_ids(search_filter: str) -> Any:
@@ -51,4 +53,6 @@ def get_identity_ids(search_filter: str) -> Any:
         "_apis/identities",
         params={"searchFilter": "General", "filterValue": search_filter},
         area="vssps.dev.azure.com",
+        # Identities rarely change and the lookup is slow and rate-limited
+        ttl=_IDENTITY_TTL,
     )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from . import client
 
@@ -49,7 +49,7 @@ def get_builds(
         params["tagFilters"] = tag_filters
     if query_order:
         params["queryOrder"] = query_order
-    return client.get_all("_apis/build/builds", project=project, params=params)
+    return client.get_all("_apis/build/builds", project=project, params=params, limit=top)
 
 
 def get_build(project: str, build_id: int) -> Dict[str, Any]:
@@ -62,6 +62,15 @@ def get_build_log(project: str, build_id: int) -> Any:
     return client.get(f"_apis/build/builds/{build_id}/logs", project=project)
 
 
+def _build_log_params(start_line: Optional[int], end_line: Optional[int]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {}
+    if start_line is not None:
+        params["startLine"] = start_line
+    if end_line is not None:
+        params["endLine"] = end_line
+    return params
+
+
 def get_build_log_by_id(
     project: str,
     build_id: int,
@@ -71,15 +80,29 @@ def get_build_log_by_id(
     end_line: Optional[int] = None,
 ) -> str:
     """Get a specific build log content."""
-    params: Dict[str, Any] = {}
-    if start_line is not None:
-        params["startLine"] = start_line
-    if end_line is not None:
-        params["endLine"] = end_line
     return client.get_text(
         f"_apis/build/builds/{build_id}/logs/{log_id}",
         project=project,
-        params=params,
+        params=_build_log_params(start_line, end_line),
+    )
+
+
+def iter_build_log_by_id(
+    project: str,
+    build_id: int,
+    log_id: int,
+    *,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Stream a build log as raw byte chunks (constant memory for large logs).
+
+    Line slicing is done server-side via ``startLine`` / ``endLine``.
+    """
+    return client.get_stream(
+        f"_apis/build/builds/{build_id}/logs/{log_id}",
+        project=project,
+        params=_build_log_params(start_line, end_line),
     )
 
 
@@ -127,7 +150,7 @@ def get_build_definitions(
         params["yamlFilename"] = yaml_filename
     if query_order:
         params["queryOrder"] = query_order
-    return client.get_all("_apis/build/definitions", project=project, params=params)
+    return client.get_all("_apis/build/definitions", project=project, params=params, limit=top)
 
 
 def get_build_definition_revisions(
@@ -2,14 +2,31 @@
 
 from __future__ import annotations
 
+import contextvars
 import os
-import pathlib
 import sys
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import quote
 
-from . import client
+from . import client, work_items
+
+_DOWNLOAD_WORKERS = 16  # pr_download runs two batches: 2 × this must fit client._POOL_MAXSIZE
+_SUMMARY_WORKERS = 8  # each pr_summary issues up to 4 requests at once: 4 × this must fit client._POOL_MAXSIZE
+_PR_TTL = 30  # seconds PR metadata and the latest-iteration lookup are reused across pr-summary / pr-download
+
+
+@lru_cache(maxsize=64)
+def _repo_path(repo: str) -> str:
+    """Return the ``_apis/git/repositories/<repo>`` prefix, name URL-quoted."""
+    return f"_apis/git/repositories/{quote(repo, safe='')}"
+
+
+def _short_ref(name: str) -> str:
+    """Strip a leading ``refs/heads/`` so full and short branch names are equivalent."""
+    return name.removeprefix("refs/heads/") if name else name
 
 
 # ---------------------------------------------------------------------------
@@ -18,18 +35,21 @@ from . import client
 
 
 def list_repos(project: str, *, top: Optional[int] = None, name_filter: Optional[str] = None) -> List[Dict[str, Any]]:
-    """List all Git repositories in a project."""
-    params: Dict[str, Any] = {}
-    if top is not None:
-        params["$top"] = top
+    """List all Git repositories in a project.
+
+    The repositories endpoint supports neither ``$filter`` nor ``$top`` and
+    always returns the full list, so both are applied client-side.
+    """
+    repos = client.get_all("_apis/git/repositories", project=project)
     if name_filter:
-        params["$filter"] = f"contains(name, '{name_filter}')"
-    return client.get_all("_apis/git/repositories", project=project, params=params)
+        needle = name_filter.lower()
+        repos = [r for r in repos if needle in r.get("name", "").lower()]
+    return repos[:top] if top is not None else repos
 
 
 def get_repo(project: str, repo: str) -> Dict[str, Any]:
     """Get repository details by name or ID."""
-    return client.get(f"_apis/git/repositories/{quote(repo, safe='')}", project=project)
+    return client.get(_repo_path(repo), project=project)
 
 
 # ---------------------------------------------------------------------------
@@ -50,16 +70,16 @@ def list_branches(
         params["filterContains"] = filter_contains
     if top is not None:
         params["$top"] = top
-    data = client.get(f"_apis/git/repositories/{quote(repo, safe='')}/refs", project=project, params={**params, "filter": "heads/"})
+    data = client.get(f"{_repo_path(repo)}/refs", project=project, params={**params, "filter": "heads/"})
     return data.get("value", []) if isinstance(data, dict) else data
 
 
 def get_branch(project: str, repo: str, branch_name: str) -> Any:
     """Get details for a specific branch."""
     # The refs endpoint with an exact filter
-    name = branch_name.removeprefix("refs/heads/")
+    name = _short_ref(branch_name)
     data = client.get(
-        f"_apis/git/repositories/{quote(repo, safe='')}/refs",
+        f"{_repo_path(repo)}/refs",
         project=project,
         params={"filter": f"heads/{name}", "filterContains": name},
     )
@@ -96,7 +116,7 @@ def search_commits(
     if search_text:
         body["searchText"] = search_text
     if branch:
-        body["itemVersion"] = {"version": branch.removeprefix("refs/heads/")}
+        body["itemVersion"] = {"version": _short_ref(branch)}
     if include_work_items is not None:
         body["includeWorkItems"] = include_work_items
 
@@ -107,7 +127,7 @@ def search_commits(
         params["$skip"] = skip
 
     return client.post(
-        f"_apis/git/repositories/{quote(repo, safe='')}/commitsbatch",
+        f"{_repo_path(repo)}/commitsbatch",
         project=project,
         json_body=body,
         params=params,
@@ -117,8 +137,9 @@ def search_commits(
 def get_commit(project: str, repo: str, commit_id: str) -> Dict[str, Any]:
     """Get a single commit by ID."""
     return client.get(
-        f"_apis/git/repositories/{quote(repo, safe='')}/commits/{commit_id}",
+        f"{_repo_path(repo)}/commits/{commit_id}",
         project=project,
+        immutable=True,
     )
 
 
@@ -130,9 +151,10 @@ def get_commit_changes(project: str, repo: str, commit_id: str, *, top: Optional
     if skip is not None:
         params["$skip"] = skip
     return client.get(
-        f"_apis/git/repositories/{quote(repo, safe='')}/commits/{commit_id}/changes",
+        f"{_repo_path(repo)}/commits/{commit_id}/changes",
         project=project,
         params=params,
+        immutable=True,
     )
 
 
@@ -171,32 +193,52 @@ def list_pull_requests(
         params["$skip"] = skip
 
     if repo:
-        path = f"_apis/git/repositories/{quote(repo, safe='')}/pullrequests"
+        path = f"{_repo_path(repo)}/pullrequests"
     else:
         path = "_apis/git/pullrequests"
-    return client.get_all(path, project=project, params=params)
+    return client.get_all(path, project=project, params=params, limit=top)
 
 
-def get_pull_request(project: str, repo: str, pr_id: int, *, include_work_items: bool = False) -> Dict[str, Any]:
-    """Get a pull request by ID."""
-    pr = client.get(
-        f"_apis/git/repositories/{quote(repo, safe='')}/pullrequests/{pr_id}",
-        project=project,
+def get_pull_request(
+    project: str,
+    repo: str,
+    pr_id: int,
+    *,
+    include_work_items: bool = False,
+    expand_work_items: bool = False,
+    ttl: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Get a pull request by ID.
+
+    ``expand_work_items`` adds the linked work items themselves under
+    ``workItems``, fetched with one batch request rather than one per
+    link (implies ``include_work_items``).  ``ttl`` (seconds) lets a
+    recent response be served from the disk cache.
+    """
+    path = f"{_repo_path(repo)}/pullrequests/{pr_id}"
+    if not (include_work_items or expand_work_items):
+        return client.get(path, project=project, ttl=ttl)
+    # The work item links don't depend on the PR body; fetch both at once
+    pr, wi = client.gather(
+        lambda: client.get(path, project=project, ttl=ttl),
+        lambda: client.get(f"{path}/workitems", project=project, ttl=ttl),
     )
-    if include_work_items:
-        wi = client.get(
-            f"_apis/git/repositories/{quote(repo, safe='')}/pullrequests/{pr_id}/workitems",
-            project=project,
-        )
-        pr["workItemRefs"] = wi.get("value", []) if isinstance(wi, dict) else wi
+    pr["workItemRefs"] = wi.get("value", []) if isinstance(wi, dict) else wi
+    if expand_work_items:
+        ids = [int(ref["id"]) for ref in pr["workItemRefs"] if ref.get("id")]
+        pr["workItems"] = work_items.get_work_items_batch(project, ids)
     return pr
 
 
-def get_pull_request_iterations(project: str, repo: str, pr_id: int) -> List[Dict[str, Any]]:
-    """Get iterations (push sets) of a pull request."""
+def get_pull_request_iterations(project: str, repo: str, pr_id: int, *, ttl: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Get iterations (push sets) of a pull request.
+
+    ``ttl`` (seconds) lets a recent response be served from the disk cache.
+    """
     data = client.get(
-        f"_apis/git/repositories/{quote(repo, safe='')}/pullrequests/{pr_id}/iterations",
+        f"{_repo_path(repo)}/pullrequests/{pr_id}/iterations",
         project=project,
+        ttl=ttl,
     )
     return data.get("value", []) if isinstance(data, dict) else data
 
@@ -212,22 +254,24 @@ def get_pull_request_changes(
     The raw API wraps this in a ``changeEntries`` key; this function
     unwraps it for consistency with other list-returning commands.
     """
-    if iteration_id:
-        path = f"_apis/git/repositories/{quote(repo, safe='')}/pullrequests/{pr_id}/iterations/{iteration_id}/changes"
-    else:
-        # Use the last iteration by default
-        iters = get_pull_request_iterations(project, repo, pr_id)
+    # An existing iteration is a fixed snapshot, so its changes never change
+    immutable = True
+    if not iteration_id:
+        # Use the last iteration by default.  A short TTL lets back-to-back
+        # pr-summary / pr-download calls on the same PR skip this round trip.
+        iters = get_pull_request_iterations(project, repo, pr_id, ttl=_PR_TTL)
         if iters:
-            last = iters[-1]["id"]
-            path = f"_apis/git/repositories/{quote(repo, safe='')}/pullrequests/{pr_id}/iterations/{last}/changes"
+            iteration_id = iters[-1]["id"]
         else:
-            path = f"_apis/git/repositories/{quote(repo, safe='')}/pullrequests/{pr_id}/iterations/1/changes"
+            iteration_id = 1
+            immutable = False
+    path = f"{_repo_path(repo)}/pullrequests/{pr_id}/iterations/{iteration_id}/changes"
     params: Dict[str, Any] = {}
     if top is not None:
         params["$top"] = top
     if skip is not None:
         params["$skip"] = skip
-    data = client.get(path, project=project, params=params)
+    data = client.get(path, project=project, params=params, immutable=immutable)
     # Normalize: raw API uses "changeEntries"; unwrap for consistency
     if isinstance(data, dict):
         return data.get("changeEntries", data.get("value", []))
@@ -252,7 +296,7 @@ def list_pr_threads(
     if skip is not None:
         params["$skip"] = skip
     data = client.get(
-        f"_apis/git/repositories/{quote(repo, safe='')}/pullrequests/{pr_id}/threads",
+        f"{_repo_path(repo)}/pullrequests/{pr_id}/threads",
         project=project,
         params=params,
     )
@@ -264,7 +308,7 @@ def list_pr_thread_comments(
 ) -> List[Dict[str, Any]]:
     """List comments in a specific PR thread."""
     data = client.get(
-        f"_apis/git/repositories/{quote(repo, safe='')}/pullrequests/{pr_id}/threads/{thread_id}/comments",
+        f"{_repo_path(repo)}/pullrequests/{pr_id}/threads/{thread_id}/comments",
         project=project,
     )
     return data.get("value", []) if isinstance(data, dict) else data
@@ -275,6 +319,17 @@ def list_pr_thread_comments(
 # ---------------------------------------------------------------------------
 
 
+def _file_version_params(path: str, branch: Optional[str], commit: Optional[str]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"path": path}
+    if branch:
+        params["versionDescriptor.version"] = _short_ref(branch)
+        params["versionDescriptor.versionType"] = "branch"
+    elif commit:
+        params["versionDescriptor.version"] = commit
+        params["versionDescriptor.versionType"] = "commit"
+    return params
+
+
 def get_file_content(
     project: str,
     repo: str,
@@ -284,17 +339,33 @@ def get_file_content(
     commit: Optional[str] = None,
 ) -> str:
     """Download raw file content from a repository."""
-    params: Dict[str, Any] = {"path": path}
-    if branch:
-        params["versionDescriptor.version"] = branch.removeprefix("refs/heads/")
-        params["versionDescriptor.versionType"] = "branch"
-    elif commit:
-        params["versionDescriptor.version"] = commit
-        params["versionDescriptor.versionType"] = "commit"
     return client.get_text(
-        f"_apis/git/repositories/{quote(repo, safe='')}/items",
+        f"{_repo_path(repo)}/items",
         project=project,
-        params=params,
+        params=_file_version_params(path, branch, commit),
+        # Content at a commit never changes; content on a branch does
+        immutable=not branch and bool(commit),
+    )
+
+
+def iter_file_content(
+    project: str,
+    repo: str,
+    path: str,
+    *,
+    branch: Optional[str] = None,
+    commit: Optional[str] = None,
+) -> Iterator[bytes]:
+    """Stream raw file content as byte chunks without decoding it.
+
+    Binary files come through intact; content pinned to a commit is
+    cached byte-for-byte.
+    """
+    return client.get_stream(
+        f"{_repo_path(repo)}/items",
+        project=project,
+        params=_file_version_params(path, branch, commit),
+        immutable=not branch and bool(commit),
     )
 
 
@@ -312,15 +383,68 @@ def list_items(
         "recursionLevel": recursion,
     }
     if branch:
-        params["versionDescriptor.version"] = branch.removeprefix("refs/heads/")
+        params["versionDescriptor.version"] = _short_ref(branch)
         params["versionDescriptor.versionType"] = "branch"
     return client.get(
-        f"_apis/git/repositories/{quote(repo, safe='')}/items",
+        f"{_repo_path(repo)}/items",
         project=project,
         params=params,
     )
 
 
+def _download_one(
+    project: str,
+    repo: str,
+    file_path: str,
+    output_dir: str,
+    *,
+    branch: Optional[str],
+    commit: Optional[str],
+    retries: int,
+) -> Dict[str, Any]:
+    """Download a single file with retries; return its result entry.
+
+    The parent directory must already exist (see ``bulk_download_files``).
+    """
+    out_path = os.path.join(output_dir, file_path.lstrip("/"))
+    # Written under a temporary name so a failed attempt never leaves a
+    # truncated file at ``out_path``
+    part_path = out_path + ".part"
+    last_err: Optional[str] = None
+    ok = False
+    for attempt in range(1, retries + 2):  # retries + 1 total attempts
+        try:
+            chunks = iter_file_content(
+                project, repo, file_path,
+                branch=branch, commit=commit,
+            )
+            # Write the body as it arrives so memory stays flat for large files
+            with open(part_path, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(part_path, out_path)
+            ok = True
+            break
+        except Exception as exc:  # noqa: BLE001
+            last_err = f"{type(exc).__name__}: {exc}"
+            status = getattr(getattr(exc, "response", None), "status_code", None)
+            if isinstance(status, int) and 400 <= status < 500 and status != 429:
+                break  # missing path / no access: retrying cannot help
+            if attempt <= retries:
+                # Jittered so throttled workers do not retry in lock-step
+                time.sleep(client.retry_wait(getattr(exc, "response", None), attempt - 1))
+    if not ok and os.path.exists(part_path):
+        os.unlink(part_path)
+    entry: Dict[str, Any] = {
+        "path": file_path,
+        "status": "ok" if ok else "failed",
+        "output": out_path if ok else None,
+    }
+    if last_err and not ok:
+        entry["error"] = last_err
+    return entry
+
+
 def bulk_download_files(
     project: str,
     repo: str,
@@ -334,41 +458,38 @@ def bulk_download_files(
     """Download multiple files from a repository into a local directory tree.
 
     Each file at ``/src/Foo/Bar.cs`` is written to ``<output_dir>/src/Foo/Bar.cs``.
-    Returns a JSON-serialisable list of {path, status, output, error?} dicts.
+    Files are fetched concurrently (up to ``_DOWNLOAD_WORKERS`` at a time).
+    Returns a JSON-serialisable list of {path, status, output, error?} dicts,
+    in the same order as ``paths``; a repeated path is downloaded (and
+    listed) once.
     """
-    results: List[Dict[str, Any]] = []
+    # Two workers on the same path would race on its ``.part`` file
+    paths = list(dict.fromkeys(paths))
     total = len(paths)
-    for idx, file_path in enumerate(paths, 1):
-        out_path = os.path.join(output_dir, file_path.lstrip("/"))
-        pathlib.Path(out_path).parent.mkdir(parents=True, exist_ok=True)
-        last_err: Optional[str] = None
-        ok = False
-        for attempt in range(1, retries + 2):  # retries + 1 total attempts
-            try:
-                content = get_file_content(
-                    project, repo, file_path,
-                    branch=branch, commit=commit,
-                )
-                with open(out_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                ok = True
-                break
-            except Exception as exc:  # noqa: BLE001
-                last_err = f"{type(exc).__name__}: {exc}"
-                if attempt <= retries:
-                    time.sleep(1 * attempt)  # simple back-off
-        status = "ok" if ok else "failed"
-        entry: Dict[str, Any] = {
-            "path": file_path,
-            "status": status,
-            "output": out_path if ok else None,
+    if not total:
+        return []
+    # Create each directory once up front rather than once per file
+    for parent in {os.path.dirname(os.path.join(output_dir, p.lstrip("/"))) for p in paths}:
+        os.makedirs(parent, exist_ok=True)
+    results: List[Optional[Dict[str, Any]]] = [None] * total
+    with ThreadPoolExecutor(max_workers=min(_DOWNLOAD_WORKERS, total)) as pool:
+        futures = {
+            pool.submit(
+                contextvars.copy_context().run,
+                _download_one, project, repo, file_path, output_dir,
+                branch=branch, commit=commit, retries=retries,
+            ): idx
+            for idx, file_path in enumerate(paths)
         }
-        if last_err and not ok:
-            entry["error"] = last_err
-        results.append(entry)
-        # Progress to stderr so it doesn't pollute JSON stdout
-        print(f"[{idx}/{total}] {status}: {file_path}", file=sys.stderr)
-    return results
+        step = max(1, total // 20)  # report roughly every 5%
+        for done, future in enumerate(as_completed(futures), 1):
+            entry = future.result()
+            results[futures[future]] = entry
+            # Progress to stderr so it doesn't pollute JSON stdout; failures
+            # are always reported
+            if entry["status"] != "ok" or done % step == 0 or done == total:
+                print(f"[{done}/{total}] {entry['status']}: {entry['path']}", file=sys.stderr)
+    return results  # type: ignore[return-value]
 
 
 def get_diff(
@@ -383,15 +504,18 @@ def get_diff(
     """Get diff between two versions (commits, branches, tags)."""
     params: Dict[str, Any] = {}
     if base_version:
-        params["baseVersionDescriptor.version"] = base_version.removeprefix("refs/heads/")
+        params["baseVersionDescriptor.version"] = _short_ref(base_version)
         params["baseVersionDescriptor.versionType"] = base_version_type
     if target_version:
-        params["targetVersionDescriptor.version"] = target_version.removeprefix("refs/heads/")
+        params["targetVersionDescriptor.version"] = _short_ref(target_version)
         params["targetVersionDescriptor.versionType"] = target_version_type
     return client.get(
-        f"_apis/git/repositories/{quote(repo, safe='')}/diffs/commits",
+        f"{_repo_path(repo)}/diffs/commits",
         project=project,
         params=params,
+        # A diff between two commits is fixed; branches and tags move
+        immutable=bool(base_version and target_version)
+        and base_version_type == target_version_type == "commit",
     )
 
 
@@ -400,6 +524,28 @@ def get_diff(
 # ---------------------------------------------------------------------------
 
 
+_EMPTY: Dict[str, Any] = {}
+
+
+def _classify_changes(change_list: List[Dict[str, Any]]) -> tuple[List[str], List[str], List[str]]:
+    """Split PR change entries into (added, edited, deleted) paths in one pass.
+
+    Entries without a path and other change types (rename, …) are skipped.
+    """
+    added: List[str] = []
+    edited: List[str] = []
+    deleted: List[str] = []
+    bucket = {"add": added.append, "edit": edited.append, "delete": deleted.append}
+    for c in change_list:
+        p = (c.get("item") or _EMPTY).get("path")
+        if not p:
+            continue
+        fn = bucket.get(c.get("changeType"))
+        if fn:
+            fn(p)
+    return added, edited, deleted
+
+
 def pr_summary(
     project: str,
     repo: str,
@@ -411,33 +557,24 @@ def pr_summary(
     into a single response.  This saves several round trips compared to
     calling each API individually.
     """
-    # 1. PR metadata
-    pr = get_pull_request(project, repo, pr_id, include_work_items=True)
-
-    # 2. Changed files (normalised to a flat list)
-    changes = get_pull_request_changes(project, repo, pr_id)
+    # 1. PR metadata, 2. changed files and 3. review threads are
+    # independent, so fetch them concurrently.
+    pr, changes, all_threads = client.gather(
+        lambda: get_pull_request(project, repo, pr_id, include_work_items=True, ttl=_PR_TTL),
+        lambda: get_pull_request_changes(project, repo, pr_id),
+        lambda: list_pr_threads(project, repo, pr_id),
+    )
 
     # Classify files
-    added, edited, deleted = [], [], []
-    for c in (changes if isinstance(changes, list) else []):
-        ct = c.get("changeType", "")
-        p = c.get("item", {}).get("path", "")
-        if ct == "add":
-            added.append(p)
-        elif ct == "edit":
-            edited.append(p)
-        elif ct == "delete":
-            deleted.append(p)
-
-    # 3. Review threads — only human-authored text threads
-    all_threads = list_pr_threads(project, repo, pr_id)
+    added, edited, deleted = _classify_changes(changes if isinstance(changes, list) else [])
+
+    # Review threads — only human-authored text threads
     review_comments = []
     for t in all_threads:
-        comments = t.get("comments", [])
-        text_comments = [c for c in comments if c.get("commentType") == "text"]
-        if not text_comments:
+        # Only the first text comment is reported; stop scanning there
+        first = next((c for c in t.get("comments", ()) if c.get("commentType") == "text"), None)
+        if first is None:
             continue
-        first = text_comments[0]
         review_comments.append({
             "status": t.get("status", "unknown"),
             "author": first.get("author", {}).get("displayName", "?"),
@@ -464,6 +601,27 @@ def pr_summary(
     }
 
 
+def pr_summaries(
+    project: str,
+    repo: str,
+    pr_ids: List[int],
+    *,
+    max_concurrency: int = _SUMMARY_WORKERS,
+) -> Dict[int, Dict[str, Any]]:
+    """Return ``pr_summary`` for several PRs, fetched concurrently.
+
+    The result maps each PR id (in input order) to its summary, or to an
+    ``{"error": ...}`` dict if that PR could not be summarised, so one bad
+    id does not discard the rest.
+    """
+    summaries = client.gather(
+        *(lambda i=i: pr_summary(project, repo, i) for i in pr_ids),
+        max_workers=max(1, min(max_concurrency, _SUMMARY_WORKERS)),
+        return_errors=True,
+    )
+    return dict(zip(pr_ids, summaries))
+
+
 def pr_download(
     project: str,
     repo: str,
@@ -477,55 +635,47 @@ def pr_download(
 
     Returns a dict with metadata (commits used) and download results.
     """
-    import os
-
-    # 1. Get PR metadata for commit SHAs
-    pr = get_pull_request(project, repo, pr_id)
+    # 1. PR metadata (for commit SHAs) and 2. changed files, fetched concurrently
+    pr, changes = client.gather(
+        lambda: get_pull_request(project, repo, pr_id, ttl=_PR_TTL),
+        lambda: get_pull_request_changes(project, repo, pr_id),
+    )
     source_commit = (pr.get("lastMergeSourceCommit") or {}).get("commitId")
     target_commit = (pr.get("lastMergeTargetCommit") or {}).get("commitId")
     if not source_commit or not target_commit:
         raise ValueError("PR does not have merge commit information yet")
 
-    # 2. Get changed files
-    changes = get_pull_request_changes(project, repo, pr_id)
     change_list = changes if isinstance(changes, list) else []
 
-    added, edited, deleted = [], [], []
-    for c in change_list:
-        ct = c.get("changeType", "")
-        p = c.get("item", {}).get("path", "")
-        if not p:
-            continue
-        if ct == "add":
-            added.append(p)
-        elif ct == "edit":
-            edited.append(p)
-        elif ct == "delete":
-            deleted.append(p)
-
-    # 3. Download target (before) versions for edited + deleted files
-    before_paths = edited + deleted
-    before_results = []
-    if before_paths:
-        before_results = bulk_download_files(
+    added, edited, deleted = _classify_changes(change_list)
+    if not (added or edited or deleted):
+        # Nothing to fetch (e.g. a rename-only PR): skip the download workers
+        return {
+            "sourceCommit": source_commit,
+            "targetCommit": target_commit,
+            "files": {"added": added, "edited": edited, "deleted": deleted},
+            "downloads": {"target": [], "source": []},
+        }
+
+    # 3. Target (before) versions of edited + deleted files and 4. source
+    # (after) versions of edited + added files are independent, so both
+    # batches download at once (2 × _DOWNLOAD_WORKERS fits the session pool)
+    before_results, after_results = client.gather(
+        lambda: bulk_download_files(
             project, repo,
-            before_paths,
+            edited + deleted,
             os.path.join(output_dir, "target"),
             commit=target_commit,
             retries=retries,
-        )
-
-    # 4. Download source (after) versions for edited + added files
-    after_paths = edited + added
-    after_results = []
-    if after_paths:
-        after_results = bulk_download_files(
+        ),
+        lambda: bulk_download_files(
             project, repo,
-            after_paths,
+            edited + added,
             os.path.join(output_dir, "source"),
             commit=source_commit,
             retries=retries,
-        )
+        ),
+    )
 
     return {
         "sourceCommit": source_commit,
@@ -65,12 +65,13 @@ def get_test_results_by_build(
         params={"buildUri": f"vstfs:///Build/Build/{build_id}"},
     )
     runs = data.get("value", []) if isinstance(data, dict) else data
+    # One request per run; they are independent, so fetch them concurrently
+    per_run = client.gather(*(
+        (lambda run_id=run["id"]: client.get(f"_apis/test/runs/{run_id}/results", project=project))
+        for run in runs
+    ))
     all_results: List[Dict[str, Any]] = []
-    for run in runs:
-        results = client.get(
-            f"_apis/test/runs/{run['id']}/results",
-            project=project,
-        )
+    for run, results in zip(runs, per_run):
         run_results = results.get("value", []) if isinstance(results, dict) else results
         for r in run_results:
             r["runName"] = run.get("name")
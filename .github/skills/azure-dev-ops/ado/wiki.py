@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from . import client
 
+_METADATA_TTL = 300  # seconds wiki listings are served from the disk cache
+_PAGES_BATCH_MAX = 100  # max pages per pagesbatch request
+
 
 def list_wikis(*, project: Optional[str] = None) -> List[Dict[str, Any]]:
     """List wikis in the organization or a specific project."""
-    data = client.get("_apis/wiki/wikis", project=project)
+    data = client.get("_apis/wiki/wikis", project=project, ttl=_METADATA_TTL)
     return data.get("value", []) if isinstance(data, dict) else data
 
 
 def get_wiki(wiki_id: str, *, project: Optional[str] = None) -> Dict[str, Any]:
     """Get details of a specific wiki."""
-    return client.get(f"_apis/wiki/wikis/{wiki_id}", project=project)
+    return client.get(f"_apis/wiki/wikis/{wiki_id}", project=project, ttl=_METADATA_TTL)
 
 
 def list_pages(
@@ -25,20 +28,27 @@ def list_pages(
     top: Optional[int] = None,
     continuation_token: Optional[str] = None,
     page_views_for_days: Optional[int] = None,
-) -> Any:
-    """List pages in a wiki."""
-    params: Dict[str, Any] = {}
-    if top is not None:
-        params["$top"] = top
+) -> Dict[str, Any]:
+    """List pages in a wiki, as a ``{"count", "value"}`` dict.
+
+    ``pagesbatch`` is a POST that returns the next continuation token in the
+    ``x-ms-continuationtoken`` header; pages are followed (and prefetched)
+    until ``top`` pages have been collected.  Pass ``continuation_token`` to
+    start from a known position: with ``top`` of at most 100 that is one
+    request, since the first batch already reaches the limit.
+    """
+    body: Dict[str, Any] = {"top": min(top, _PAGES_BATCH_MAX) if top else _PAGES_BATCH_MAX}
     if continuation_token:
-        params["continuationToken"] = continuation_token
+        body["continuationToken"] = continuation_token
     if page_views_for_days is not None:
-        params["pageViewsForDays"] = page_views_for_days
-    return client.get(
+        body["pageViewsForDays"] = page_views_for_days
+    pages = client.get_all(
         f"_apis/wiki/wikis/{wiki_id}/pagesbatch",
         project=project,
-        params=params,
+        json_body=body,
+        limit=top,
     )
+    return {"count": len(pages), "value": pages}
 
 
 def get_page(
@@ -70,3 +80,33 @@ def get_page_content(
         project=project,
         params={"path": path, "includeContent": "true"},
     )
+
+
+def get_pages_content(
+    project: str,
+    wiki_id: str,
+    paths: List[str],
+) -> Dict[str, Any]:
+    """Retrieve the content of several wiki pages concurrently, keyed by path.
+
+    A page that cannot be read maps to an ``{"error": ...}`` dict instead of
+    failing the whole request.
+    """
+    contents = client.gather(
+        *(lambda p=p: get_page_content(project, wiki_id, p) for p in paths),
+        return_errors=True,
+    )
+    return dict(zip(paths, contents))
+
+
+def iter_page_content(
+    project: str,
+    wiki_id: str,
+    path: str,
+) -> Iterator[bytes]:
+    """Stream wiki page content as raw byte chunks."""
+    return client.get_stream(
+        f"_apis/wiki/wikis/{wiki_id}/pages",
+        project=project,
+        params={"path": path, "includeContent": "true"},
+    )
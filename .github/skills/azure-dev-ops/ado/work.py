@@ -6,6 +6,8 @@ from typing import Any, Dict, List, Optional
 
 from . import client
 
+_METADATA_TTL = 300  # seconds the iteration tree is served from the disk cache
+
 
 def list_iterations(
     project: str,
@@ -20,6 +22,7 @@ def list_iterations(
         "_apis/wit/classificationnodes/iterations",
         project=project,
         params=params,
+        ttl=_METADATA_TTL,
     )
 
 
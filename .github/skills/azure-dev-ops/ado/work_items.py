@@ -6,6 +6,10 @@ from typing import Any, Dict, List, Optional
 
 from . import client
 
+_BATCH_SIZE = 200  # max IDs per workitemsbatch request
+_PER_ITEM_WORKERS = 10  # concurrent per-work-item requests in the *_many helpers
+_METADATA_TTL = 300  # seconds process metadata (work item types) is served from the disk cache
+
 
 def get_work_item(
     project: str,
@@ -23,7 +27,8 @@ def get_work_item(
         params["$expand"] = expand
     if as_of:
         params["asOf"] = as_of
-    return client.get(f"_apis/wit/workitems/{work_item_id}", project=project, params=params)
+    # A work item as of a point in time is immutable; the live one is not
+    return client.get(f"_apis/wit/workitems/{work_item_id}", project=project, params=params, immutable=bool(as_of))
 
 
 def get_work_items_batch(
@@ -32,12 +37,35 @@ def get_work_items_batch(
     *,
     fields: Optional[List[str]] = None,
 ) -> List[Dict[str, Any]]:
-    """Retrieve multiple work items by IDs (batch)."""
-    body: Dict[str, Any] = {"ids": ids}
-    if fields:
-        body["fields"] = fields
-    data = client.post("_apis/wit/workitemsbatch", project=project, json_body=body)
-    return data.get("value", []) if isinstance(data, dict) else data
+    """Retrieve multiple work items by IDs (batch).
+
+    The API caps a batch at 200 IDs; larger lists are split into chunks
+    fetched concurrently, and results keep the order of ``ids``.
+    """
+    def fetch(chunk: List[int]) -> List[Dict[str, Any]]:
+        body: Dict[str, Any] = {"ids": chunk}
+        if fields:
+            body["fields"] = fields
+        data = client.post("_apis/wit/workitemsbatch", project=project, json_body=body)
+        return data.get("value", []) if isinstance(data, dict) else data
+
+    chunks = [ids[i:i + _BATCH_SIZE] for i in range(0, len(ids), _BATCH_SIZE)]
+    if len(chunks) <= 1:
+        return fetch(ids) if ids else []
+    pages = client.gather(*(lambda c=c: fetch(c) for c in chunks))
+    return [item for page in pages for item in page]
+
+
+def _expand_query_result(project: Optional[str], result: Any) -> Any:
+    """Replace the ID references of a WIQL result with the work items.
+
+    Only the query's SELECT columns are fetched.
+    """
+    if not isinstance(result, dict) or not result.get("workItems"):
+        return result
+    ids = [ref["id"] for ref in result["workItems"]]
+    fields = [col["referenceName"] for col in result.get("columns", [])] or None
+    return {**result, "workItems": get_work_items_batch(project, ids, fields=fields)}
 
 
 def list_comments(
@@ -82,14 +110,71 @@ def list_revisions(
     return data.get("value", []) if isinstance(data, dict) else data
 
 
+def list_comments_many(
+    project: str,
+    work_item_ids: List[int],
+    *,
+    top: Optional[int] = None,
+) -> Dict[int, Any]:
+    """List comments for several work items concurrently, keyed by ID.
+
+    An ID that cannot be read (deleted, no access) maps to an
+    ``{"error": ...}`` dict instead of failing the whole batch.
+    """
+    comments = client.gather(
+        *(lambda i=i: list_comments(project, i, top=top) for i in work_item_ids),
+        max_workers=_PER_ITEM_WORKERS,
+        return_errors=True,
+    )
+    return dict(zip(work_item_ids, comments))
+
+
+def list_revisions_many(
+    project: str,
+    work_item_ids: List[int],
+    *,
+    top: Optional[int] = None,
+    expand: Optional[str] = None,
+) -> Dict[int, Any]:
+    """Get revision histories for several work items concurrently, keyed by ID.
+
+    An ID that cannot be read maps to an ``{"error": ...}`` dict instead of
+    failing the whole batch.
+    """
+    revisions = client.gather(
+        *(lambda i=i: list_revisions(project, i, top=top, expand=expand) for i in work_item_ids),
+        max_workers=_PER_ITEM_WORKERS,
+        return_errors=True,
+    )
+    return dict(zip(work_item_ids, revisions))
+
+
 def get_work_item_type(project: str, type_name: str) -> Dict[str, Any]:
     """Get details of a work item type."""
     return client.get(
         f"_apis/wit/workitemtypes/{type_name}",
         project=project,
+        ttl=_METADATA_TTL,
     )
 
 
+_OPEN_STATES_CLAUSE = " AND [System.State] <> 'Closed' AND [System.State] <> 'Done' AND [System.State] <> 'Removed'"
+
+# my_work_items queries, keyed by (type filtered?, include completed?), so
+# only four distinct query shapes ever reach the server.  ``{type}`` is
+# filled in with the escaped work item type.
+_MY_WORK_WIQL = {
+    (has_type, include_completed): (
+        "SELECT [System.Id] FROM WorkItems WHERE [System.AssignedTo] = @Me"
+        + (" AND [System.WorkItemType] = '{type}'" if has_type else "")
+        + ("" if include_completed else _OPEN_STATES_CLAUSE)
+        + " ORDER BY [System.ChangedDate] DESC"
+    )
+    for has_type in (False, True)
+    for include_completed in (False, True)
+}
+
+
 def my_work_items(
     project: str,
     *,
@@ -98,12 +183,10 @@ def my_work_items(
     include_completed: bool = False,
 ) -> List[Dict[str, Any]]:
     """List work items assigned to the authenticated user via WIQL."""
-    wiql = "SELECT [System.Id] FROM WorkItems WHERE [System.AssignedTo] = @Me"
+    wiql = _MY_WORK_WIQL[(bool(type_filter), bool(include_completed))]
     if type_filter:
-        wiql += f" AND [System.WorkItemType] = '{type_filter}'"
-    if not include_completed:
-        wiql += " AND [System.State] <> 'Closed' AND [System.State] <> 'Done' AND [System.State] <> 'Removed'"
-    wiql += " ORDER BY [System.ChangedDate] DESC"
+        # WIQL string literals escape a quote by doubling it
+        wiql = wiql.format(type=type_filter.replace("'", "''"))
 
     result = client.post(
         "_apis/wit/wiql",
@@ -124,19 +207,25 @@ def run_wiql(
     *,
     top: Optional[int] = None,
     team: Optional[str] = None,
+    expand_ids: bool = False,
 ) -> Any:
-    """Execute a WIQL query and return results."""
+    """Execute a WIQL query and return results.
+
+    With ``expand_ids`` the work item references are replaced by the work
+    items themselves, fetched in batches.
+    """
     params: Dict[str, Any] = {}
     if top is not None:
         params["$top"] = top
     if team:
         params["team"] = team
-    return client.post(
+    result = client.post(
         "_apis/wit/wiql",
         project=project,
         json_body={"query": query},
         params=params,
     )
+    return _expand_query_result(project, result) if expand_ids else result
 
 
 def get_query(
@@ -165,19 +254,21 @@ def get_query_results(
     project: Optional[str] = None,
     top: Optional[int] = None,
     team: Optional[str] = None,
+    expand_ids: bool = False,
 ) -> Any:
-    """Execute a saved query by ID and return results."""
+    """Execute a saved query by ID and return results (see ``run_wiql``)."""
     params: Dict[str, Any] = {}
     if top is not None:
         params["$top"] = top
     if team:
         params["team"] = team
-    return client.post(
+    result = client.post(
         f"_apis/wit/wiql/{query_id}",
         project=project,
         json_body={},
         params=params,
     )
+    return _expand_query_result(project, result) if expand_ids else result
 
 
 def get_work_items_for_iteration(
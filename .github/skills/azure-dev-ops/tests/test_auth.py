@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import sys
 import tempfile
 import time
 import unittest
@@ -103,7 +104,7 @@ class TestGetToken(unittest.TestCase):
         mock_cred = MagicMock()
         mock_cred.return_value.get_token.return_value = mock_access
 
-        with patch("ado.auth.AzureCliCredential", mock_cred):
+        with patch("azure.identity.AzureCliCredential", mock_cred):
             result = auth.get_token()
             self.assertEqual(result, "cli_token")
             mock_save.assert_called_once()
@@ -111,12 +112,30 @@ class TestGetToken(unittest.TestCase):
     @patch.object(auth, "_save_cache")
     @patch.object(auth, "_load_cache", return_value=None)
     def test_raises_when_all_fail(self, mock_load, mock_save):
-        with patch("ado.auth.AzureCliCredential", side_effect=Exception("no cli")):
-            with patch("ado.auth.DefaultAzureCredential", side_effect=Exception("no default")):
+        with patch("azure.identity.AzureCliCredential", side_effect=Exception("no cli")):
+            with patch("azure.identity.DefaultAzureCredential", side_effect=Exception("no default")):
                 with self.assertRaises(RuntimeError) as ctx:
                     auth.get_token()
                 self.assertIn("Unable to authenticate", str(ctx.exception))
 
 
+    def test_disk_cache_hit_skips_azure_identity(self):
+        import subprocess
+        with tempfile.TemporaryDirectory() as td:
+            with open(os.path.join(td, "token_cache.json"), "w") as f:
+                json.dump({"token": "disk_token", "expires_on": time.time() + 3600}, f)
+            code = (
+                "import sys\n"
+                "from ado import auth\n"
+                "print(auth.get_token(), 'azure.identity' in sys.modules)\n"
+            )
+            out = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                cwd=os.path.dirname(os.path.dirname(os.path.abspath(auth.__file__))),
+                env={**os.environ, "ADO_SKILL_CACHE_DIR": td},
+            ).stdout.split()
+        self.assertEqual(out, ["disk_token", "False"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,153 @@
+"""Tests for ado/cache.py — immutable response cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from ado import cache, client, pipelines
+
+
+class TestCache(unittest.TestCase):
+    """load / store round-trip through the cache directory."""
+
+    def setUp(self):
+        self._td = tempfile.TemporaryDirectory()
+        self._patch = patch.object(cache, "_CACHE_DIR", Path(self._td.name) / "responses")
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        self._td.cleanup()
+
+    def test_miss_when_empty(self):
+        self.assertIs(cache.load("json", "https://x/a", {}), cache.MISS)
+
+    def test_round_trip(self):
+        cache.store("json", "https://x/a", {"api-version": "7.2"}, {"id": 1})
+        self.assertEqual(cache.load("json", "https://x/a", {"api-version": "7.2"}), {"id": 1})
+
+    def test_key_includes_params_and_kind(self):
+        cache.store("json", "https://x/a", {"p": 1}, {"id": 1})
+        self.assertIs(cache.load("json", "https://x/a", {"p": 2}), cache.MISS)
+        self.assertIs(cache.load("text", "https://x/a", {"p": 1}), cache.MISS)
+
+    def test_max_age_expires_entry(self):
+        cache.store("json", "https://x/a", {}, {"id": 1})
+        self.assertEqual(cache.load("json", "https://x/a", {}, max_age=60), {"id": 1})
+        old = cache._entry_path("json", "https://x/a", {})
+        os.utime(old, (0, 0))
+        self.assertIs(cache.load("json", "https://x/a", {}, max_age=60), cache.MISS)
+        self.assertEqual(cache.load("json", "https://x/a", {}), {"id": 1})
+
+    def test_disabled_by_env(self):
+        with patch.dict(os.environ, {"ADO_SKILL_NO_CACHE": "1"}):
+            cache.store("json", "https://x/a", {}, {"id": 1})
+            self.assertIs(cache.load("json", "https://x/a", {}), cache.MISS)
+
+
+class TestStreamCache(unittest.TestCase):
+    """Raw bodies are cached as they stream and replayed byte-for-byte."""
+
+    def setUp(self):
+        client.set_org("myorg")
+        self._td = tempfile.TemporaryDirectory()
+        self._patch = patch.object(cache, "_CACHE_DIR", Path(self._td.name) / "responses")
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        self._td.cleanup()
+
+    def _resp(self, chunks):
+        resp = MagicMock()
+        resp.iter_content.return_value = iter(chunks)
+        return resp
+
+    @patch("ado.client._headers", return_value={})
+    @patch("ado.client._request_with_retry")
+    def test_second_read_served_from_disk(self, mock_req, mock_headers):
+        body = [b"\x89PNG\r\n", b"\x00\xff"]
+        mock_req.return_value = self._resp(body)
+        first = b"".join(client.get_stream("_apis/git/repositories/r/items", immutable=True))
+        second = b"".join(client.get_stream("_apis/git/repositories/r/items", immutable=True))
+        self.assertEqual(first, b"".join(body))
+        self.assertEqual(second, first)
+        self.assertEqual(mock_req.call_count, 1)
+
+    @patch("ado.client._headers", return_value={})
+    @patch("ado.client._request_with_retry")
+    def test_abandoned_stream_not_cached(self, mock_req, mock_headers):
+        mock_req.return_value = self._resp([b"a", b"b"])
+        chunks = client.get_stream("_apis/git/repositories/r/items", immutable=True)
+        next(chunks)
+        chunks.close()
+        self.assertEqual(list(cache._CACHE_DIR.iterdir()), [])
+
+    @patch("ado.cache.os.replace", side_effect=OSError("disk full"))
+    def test_publish_error_does_not_break_stream(self, mock_replace):
+        chunks = cache.store_stream("u", None, iter([b"a", b"b"]))
+        self.assertEqual(b"".join(chunks), b"ab")
+        self.assertEqual(list(cache._CACHE_DIR.iterdir()), [])
+
+
+class TestClientImmutable(unittest.TestCase):
+    """client.get only consults the cache for immutable requests."""
+
+    def setUp(self):
+        client.set_org("myorg")
+        self._td = tempfile.TemporaryDirectory()
+        self._patch = patch.object(cache, "_CACHE_DIR", Path(self._td.name) / "responses")
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        self._td.cleanup()
+
+    def _resp(self, data):
+        resp = MagicMock()
+        resp.headers = {"Content-Type": "application/json"}
+        resp.content = json.dumps(data).encode()
+        return resp
+
+    @patch("ado.client._headers", return_value={})
+    @patch("ado.client._request_with_retry")
+    def test_immutable_hits_network_once(self, mock_req, mock_headers):
+        mock_req.return_value = self._resp({"commitId": "abc"})
+        first = client.get("_apis/git/repositories/r/commits/abc", immutable=True)
+        second = client.get("_apis/git/repositories/r/commits/abc", immutable=True)
+        self.assertEqual(first, second)
+        self.assertEqual(mock_req.call_count, 1)
+
+    @patch("ado.client._headers", return_value={})
+    @patch("ado.client._request_with_retry")
+    def test_ttl_caches_identity_lookup(self, mock_req, mock_headers):
+        from ado import core
+        mock_req.return_value = self._resp({"value": [{"id": "guid"}]})
+        core.get_identity_ids("someone@example.com")
+        core.get_identity_ids("someone@example.com")
+        self.assertEqual(mock_req.call_count, 1)
+
+    @patch("ado.client._headers", return_value={})
+    @patch("ado.client._request_with_retry")
+    def test_mutable_not_cached(self, mock_req, mock_headers):
+        mock_req.return_value = self._resp({"value": []})
+        client.get("_apis/projects")
+        client.get("_apis/projects")
+        self.assertEqual(mock_req.call_count, 2)
+
+    @patch("ado.client._headers", return_value={})
+    @patch("ado.client._request_with_retry")
+    def test_completed_build_not_cached(self, mock_req, mock_headers):
+        # Re-running failed jobs reopens a completed build under the same ID
+        mock_req.return_value = self._resp({"status": "completed", "result": "failed"})
+        pipelines.get_build("P", 1)
+        pipelines.get_build("P", 1)
+        self.assertEqual(mock_req.call_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
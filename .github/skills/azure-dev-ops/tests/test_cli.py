@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import argparse
 import importlib
 import sys
+import threading
 import unittest
+from unittest.mock import patch
 
 
 def _import_cli():
@@ -19,18 +22,7 @@ def _import_cli():
 
 
 cli_module = _import_cli()
-
-
-class TestIntOrNone(unittest.TestCase):
-
-    def test_none(self):
-        self.assertIsNone(cli_module._int_or_none(None))
-
-    def test_numeric_string(self):
-        self.assertEqual(cli_module._int_or_none("42"), 42)
-
-    def test_zero(self):
-        self.assertEqual(cli_module._int_or_none("0"), 0)
+cli_path = cli_module.__file__
 
 
 class TestBoolFlag(unittest.TestCase):
@@ -39,7 +31,7 @@ class TestBoolFlag(unittest.TestCase):
         self.assertIsNone(cli_module._bool_flag(None))
 
     def test_true_variants(self):
-        for val in ("true", "True", "TRUE", "1", "yes", "Yes"):
+        for val in ("true", "True", "TRUE", "1", "yes", "Yes", " true "):
             self.assertTrue(cli_module._bool_flag(val), f"Expected True for {val!r}")
 
     def test_false_variants(self):
@@ -59,6 +51,19 @@ class TestListOfInts(unittest.TestCase):
         self.assertEqual(cli_module._list_of_ints("10 , 20 , 30"), [10, 20, 30])
 
 
+class TestCsv(unittest.TestCase):
+
+    def test_strips_and_skips_blanks(self):
+        self.assertEqual(cli_module._csv(" /a.cs, /b.cs,"), ["/a.cs", "/b.cs"])
+
+    def test_empty_is_empty_list(self):
+        self.assertEqual(cli_module._csv(""), [])
+        self.assertEqual(cli_module._csv(" , "), [])
+
+    def test_none_passes_through(self):
+        self.assertIsNone(cli_module._csv(None))
+
+
 class TestBuildParser(unittest.TestCase):
     """build_parser creates a complete argument parser."""
 
@@ -80,7 +85,7 @@ class TestBuildParser(unittest.TestCase):
             "--org", "myorg", "repos", "get-pr",
             "--project", "MyProject", "--repo", "my-repo", "--pr-id", "123",
         ])
-        self.assertEqual(args.pr_id, "123")
+        self.assertEqual(args.pr_id, 123)
         self.assertEqual(args.project, "MyProject")
 
     def test_repos_pr_summary(self):
@@ -90,6 +95,20 @@ class TestBuildParser(unittest.TestCase):
         ])
         self.assertEqual(args.command, "pr-summary")
 
+    def test_repos_pr_summaries(self):
+        args = self.parser.parse_args([
+            "--org", "myorg", "repos", "pr-summaries",
+            "--project", "P", "--repo", "R", "--pr-ids", "4,7",
+        ])
+        self.assertEqual(args.pr_ids, [4, 7])
+
+    def test_wiki_contents(self):
+        args = self.parser.parse_args([
+            "--org", "myorg", "wiki", "contents",
+            "--project", "P", "--wiki-id", "P.wiki", "--paths", "/A,/B",
+        ])
+        self.assertEqual(args.paths, ["/A", "/B"])
+
     def test_repos_pr_download(self):
         args = self.parser.parse_args([
             "--org", "myorg", "repos", "pr-download",
@@ -110,7 +129,7 @@ class TestBuildParser(unittest.TestCase):
             "--org", "myorg", "wit", "get",
             "--project", "P", "--id", "42",
         ])
-        self.assertEqual(args.id, "42")
+        self.assertEqual(args.id, 42)
 
     def test_search_code(self):
         args = self.parser.parse_args([
@@ -142,5 +161,242 @@ class TestBuildParser(unittest.TestCase):
                     self.parser.parse_args(["--org", "myorg", cat])
 
 
+def _subparsers(parser: argparse.ArgumentParser) -> dict[str, argparse.ArgumentParser]:
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return dict(action.choices)
+    return {}
+
+
+class TestCommandTable(unittest.TestCase):
+    """COMMANDS stays in sync with the parser and the ado.* modules."""
+
+    def setUp(self):
+        self.parser = cli_module.build_parser()
+
+    def test_every_parser_command_is_registered(self):
+        registered = {
+            (cat, cmd)
+            for cat, cat_parser in _subparsers(self.parser).items()
+            for cmd in _subparsers(cat_parser)
+        }
+        self.assertEqual(registered, set(cli_module.COMMANDS))
+
+    def test_dests_and_functions_exist(self):
+        categories = _subparsers(self.parser)
+        for (cat, cmd), (mod_name, fn_name, positional, keyword) in cli_module.COMMANDS.items():
+            with self.subTest(command=f"{cat} {cmd}"):
+                cmd_parser = _subparsers(categories[cat])[cmd]
+                dests = {a.dest for a in cmd_parser._actions}
+                for dest, _ in positional:
+                    self.assertIn(dest, dests)
+                for _, dest, _ in keyword:
+                    self.assertIn(dest, dests)
+                self.assertTrue(callable(getattr(importlib.import_module(mod_name), fn_name)))
+
+
+class TestDispatch(unittest.TestCase):
+    """_dispatch converts arguments and routes output."""
+
+    def setUp(self):
+        self.parser = cli_module.build_parser()
+
+    @patch("ado.client.output")
+    @patch("ado.work_items.get_work_item")
+    def test_converts_and_omits_none(self, mock_fn, mock_output):
+        mock_fn.return_value = {"id": 42}
+        args = self.parser.parse_args([
+            "--org", "myorg", "wit", "get", "--project", "P", "--id", "42", "--expand", "all",
+        ])
+        args.func(args)
+        mock_fn.assert_called_once_with("P", 42, expand="all")
+        mock_output.assert_called_once_with({"id": 42})
+
+    @patch("ado.client.output_stream")
+    @patch("ado.repos.iter_file_content")
+    def test_file_command_streams(self, mock_fn, mock_output_stream):
+        mock_fn.return_value = iter([b"file body"])
+        args = self.parser.parse_args([
+            "--org", "myorg", "repos", "get-file",
+            "--project", "P", "--repo", "R", "--path", "/a.txt", "--branch", "main",
+        ])
+        args.func(args)
+        mock_fn.assert_called_once_with("P", "R", "/a.txt", branch="main")
+        mock_output_stream.assert_called_once_with(mock_fn.return_value)
+
+    @patch("ado.client.output_stream")
+    @patch("ado.client.iter_all")
+    def test_ndjson_list_command_streams(self, mock_iter, mock_output_stream):
+        items = iter([{"id": 1}, {"id": 2}])
+        mock_iter.return_value = items
+        args = self.parser.parse_args(["--org", "myorg", "--ndjson", "core", "list-projects", "--top", "2"])
+        args.func(args)
+        chunks = mock_output_stream.call_args[0][0]
+        self.assertEqual(next(chunks), b'{"id":1}\n')
+        self.assertEqual(next(items), {"id": 2})  # not drained before output starts
+
+    @patch("ado.client.output")
+    @patch("ado.client.iter_all")
+    def test_list_command_without_ndjson_outputs_list(self, mock_iter, mock_output):
+        mock_iter.return_value = iter([{"id": 1}])
+        args = self.parser.parse_args(["--org", "myorg", "core", "list-projects"])
+        args.func(args)
+        mock_output.assert_called_once_with([{"id": 1}])
+
+    @patch("ado.client.output")
+    @patch("ado.repos.bulk_download_files")
+    def test_bulk_download_splits_paths(self, mock_fn, mock_output):
+        mock_fn.return_value = []
+        args = self.parser.parse_args([
+            "--org", "myorg", "repos", "bulk-download",
+            "--project", "P", "--repo", "R", "--paths", "/a.cs, /b.cs,",
+            "--output-dir", "out",
+        ])
+        args.func(args)
+        mock_fn.assert_called_once_with("P", "R", ["/a.cs", "/b.cs"], "out", retries=2)
+
+
+class TestLazyImports(unittest.TestCase):
+    """The CLI module does not import the HTTP stack at load time or for --help."""
+
+    def test_no_client_import(self):
+        import subprocess
+        import os
+        code = (
+            "import importlib.util, sys\n"
+            f"spec = importlib.util.spec_from_file_location('ado_cli', {cli_path!r})\n"
+            "mod = importlib.util.module_from_spec(spec); spec.loader.exec_module(mod)\n"
+            "mod.build_parser()\n"
+            "sys.argv = ['ado.py', '--org', 'x', 'repos', 'list', '--help']\n"
+            "import contextlib, io\n"
+            "with contextlib.redirect_stdout(io.StringIO()), contextlib.suppress(SystemExit):\n"
+            "    mod.main()\n"
+            "import threading\n"
+            "[t.join() for t in threading.enumerate() if t.name == 'ado-prewarm']\n"
+            "print('requests' in sys.modules, 'ado.client' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(cli_path),
+        ).stdout.split()
+        self.assertEqual(out, ["False", "False"])
+
+
+class TestPrewarm(unittest.TestCase):
+    """The category module is imported in the background before parsing."""
+
+    def test_subcommand_skips_top_level_options(self):
+        for argv, expected in (
+            (["--org", "myorg", "repos", "list"], ("repos", "list")),
+            (["--org=myorg", "-o", "out.json", "--ndjson", "wit", "get"], ("wit", "get")),
+            (["--org", "myorg", "repos", "--help"], ("repos", None)),
+            (["--org", "myorg"], (None, None)),
+            (["--help"], (None, None)),
+        ):
+            with self.subTest(argv=argv):
+                self.assertEqual(cli_module._subcommand_of(argv), expected)
+
+    def test_imports_client_and_category_module(self):
+        with patch("importlib.import_module") as import_module:
+            cli_module._prewarm(["--org", "myorg", "wit", "get", "--id", "1"])
+            for t in threading.enumerate():
+                if t.name == "ado-prewarm":
+                    t.join()
+        self.assertEqual(
+            [c.args[0] for c in import_module.call_args_list],
+            ["ado.client", "ado.work_items"],
+        )
+
+    def test_unknown_category_starts_nothing(self):
+        with patch("threading.Thread") as thread:
+            cli_module._prewarm(["--org", "myorg", "nope", "x"])
+        thread.assert_not_called()
+
+    def test_help_starts_nothing(self):
+        with patch("threading.Thread") as thread:
+            cli_module._prewarm(["--org", "myorg", "repos", "--help"])
+            cli_module._prewarm(["repos", "list", "-h"])
+        thread.assert_not_called()
+
+
+class TestPartialParser(unittest.TestCase):
+    """build_parser(argv) registers only the subtree argv selects."""
+
+    @staticmethod
+    def _choices(parser):
+        sub = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+        return sub.choices
+
+    def test_known_command_registers_one_parser(self):
+        argv = ["--org", "myorg", "repos", "get-pr", "--project", "P", "--repo", "R", "--pr-id", "1"]
+        parser = cli_module.build_parser(argv)
+        categories = self._choices(parser)
+        self.assertEqual(list(categories), ["repos"])
+        self.assertEqual(list(self._choices(categories["repos"])), ["get-pr"])
+        self.assertEqual(vars(parser.parse_args(argv)), vars(cli_module.build_parser().parse_args(argv)))
+
+    def test_category_registers_all_its_commands(self):
+        for argv in (["--org", "myorg", "repos", "--help"], ["--org", "myorg", "repos", "nope"]):
+            with self.subTest(argv=argv):
+                commands = self._choices(self._choices(cli_module.build_parser(argv))["repos"])
+                self.assertEqual(set(commands), {c for cat, c in cli_module.COMMANDS if cat == "repos"})
+
+    def test_unknown_category_registers_everything(self):
+        for argv in (["--org", "myorg", "nope"], ["--help"]):
+            with self.subTest(argv=argv):
+                parser = cli_module.build_parser(argv)
+                self.assertEqual(set(self._choices(parser)), set(cli_module._CATEGORY_HELP))
+
+
+class TestFastParse(unittest.TestCase):
+    """_fast_parse matches argparse for well-formed input and defers otherwise."""
+
+    def setUp(self):
+        self.parser = cli_module.build_parser()
+
+    def _assert_same(self, argv):
+        fast = vars(cli_module._fast_parse(argv))
+        slow = vars(self.parser.parse_args(argv))
+        self.assertEqual(fast, slow)
+
+    def test_matches_argparse(self):
+        for argv in (
+            ["--org", "myorg", "core", "list-projects"],
+            ["--org", "myorg", "-o", "out.json", "repos", "get-pr", "--project", "P", "--repo", "R", "--pr-id", "1"],
+            ["--org=myorg", "repos", "pr-download", "--project", "P", "--repo", "R", "--pr-id", "5", "--output-dir=/tmp/x"],
+            ["--org", "myorg", "wit", "wiql", "--project", "P", "--query", "SELECT [System.Id] FROM WorkItems"],
+            ["--org", "myorg", "--ndjson", "repos", "list", "--project", "P"],
+        ):
+            with self.subTest(argv=argv):
+                self._assert_same(argv)
+
+    def test_converts_values(self):
+        args = cli_module._fast_parse([
+            "--org", "myorg", "repos", "list-prs", "--project", "P", "--top", "5",
+        ])
+        self.assertEqual(args.top, 5)
+        args = cli_module._fast_parse([
+            "--org", "myorg", "repos", "pr-download", "--project", "P", "--repo", "R",
+            "--pr-id", "5", "--output-dir", "out",
+        ])
+        self.assertEqual(args.retries, 2)
+
+    def test_defers_to_argparse(self):
+        for argv in (
+            ["--org", "myorg", "wit", "get", "--project", "P", "--id", "abc"],  # bad int
+            [],
+            ["--help"],
+            ["--org", "myorg", "core"],
+            ["--org", "myorg", "core", "list-projects", "--help"],
+            ["--org", "myorg", "repos", "get", "--project", "P"],  # missing --repo
+            ["--org", "myorg", "repos", "get", "--proj", "P", "--repo", "R"],  # abbreviation
+            ["--org", "myorg", "repos", "get", "--project", "P", "--repo"],  # missing value
+            ["--org", "myorg", "nope", "list"],
+            ["core", "list-projects"],  # missing --org
+        ):
+            with self.subTest(argv=argv):
+                self.assertIsNone(cli_module._fast_parse(argv))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -6,6 +6,7 @@ import io
 import json
 import os
 import tempfile
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -36,6 +37,27 @@ class TestSetOrg(unittest.TestCase):
             client._org()
 
 
+class TestOrgScope(unittest.TestCase):
+    """org_scope overrides the organization per context."""
+
+    def setUp(self):
+        client.set_org("default")
+
+    def test_scope_overrides_and_restores(self):
+        with client.org_scope("other"):
+            self.assertEqual(client._org(), "https://dev.azure.com/other")
+        self.assertEqual(client._org(), "https://dev.azure.com/default")
+
+    def test_gather_workers_inherit_scope(self):
+        def in_org(org):
+            with client.org_scope(org):
+                return client.gather(client._org, client._org)
+        self.assertEqual(
+            client.gather(lambda: in_org("a"), lambda: in_org("https://x.visualstudio.com/")),
+            [["https://dev.azure.com/a"] * 2, ["https://x.visualstudio.com"] * 2],
+        )
+
+
 class TestBuildUrl(unittest.TestCase):
     """_build_url constructs correct URLs."""
 
@@ -115,6 +137,80 @@ class TestOutput(unittest.TestCase):
             with open(path) as f:
                 self.assertEqual(f.read(), "hello")
 
+    def test_json_bytes_matches_stdlib_layout(self):
+        data = {"a": [1, 2], "b": {"c": None}}
+        expected = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+        self.assertEqual(client._json_bytes(data), expected)
+        with patch.object(client, "orjson", None):
+            self.assertEqual(client._json_bytes(data), expected)
+
+    def test_json_body_orjson_and_stdlib(self):
+        resp = MagicMock()
+        resp.content = '{"a": [1, 2], "b": "caf\u00e9"}'.encode("utf-8")
+        expected = {"a": [1, 2], "b": "caf\u00e9"}
+        self.assertEqual(client._json_body(resp), expected)
+        with patch.object(client, "orjson", None):
+            self.assertEqual(client._json_body(resp), expected)
+
+    def test_json_body_refuses_oversized(self):
+        resp = MagicMock()
+        resp.headers = {"Content-Length": str(client._MAX_JSON_BYTES + 1)}
+        with self.assertRaises(RuntimeError) as ctx:
+            client._json_body(resp)
+        self.assertIn("too large", str(ctx.exception))
+        resp.close.assert_called_once()
+
+    def test_json_body_limit_applies_to_decompressed_size(self):
+        resp = MagicMock()
+        # gzip-encoded: the wire size is small, the decoded body is not
+        resp.headers = {"Content-Length": "1024", "Content-Encoding": "gzip"}
+        resp.content = b" " * (client._MAX_JSON_BYTES + 1)
+        with self.assertRaises(RuntimeError) as ctx:
+            client._json_body(resp)
+        self.assertIn("too large", str(ctx.exception))
+
+    def test_json_bytes_default_str(self):
+        import datetime
+        with patch.object(client, "orjson", None):
+            out = client._json_bytes({"d": datetime.date(2024, 1, 2), "s": {1}})
+        self.assertIn(b'"2024-01-02"', out)
+
+    def test_output_stream_to_file(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "log.txt")
+            client.set_output_file(path)
+            client.output_stream(iter([b"line 1\n", b"line 2\n"]))
+            client.set_output_file(None)
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"line 1\nline 2\n")
+
+    def test_output_stream_to_stdout_adds_final_newline(self):
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            client.output_stream(iter([b"abc", b"def"]))
+            self.assertEqual(mock_out.getvalue(), "abcdef\n")
+
+    def test_output_ndjson(self):
+        client.set_ndjson(True)
+        try:
+            with patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+                client.output([{"id": 1}, {"id": 2, "name": "x"}])
+                lines = mock_out.getvalue().splitlines()
+        finally:
+            client.set_ndjson(False)
+        self.assertEqual([json.loads(l) for l in lines], [{"id": 1}, {"id": 2, "name": "x"}])
+
+    def test_ndjson_bytes_stdlib_fallback(self):
+        with patch.object(client, "orjson", None):
+            self.assertEqual(client._ndjson_bytes([{"a": 1}, 2]), b'{"a":1}\n2\n')
+            self.assertEqual(client._ndjson_bytes({"a": 1}), b'{"a":1}\n')
+
+    def test_non_ascii_emitted_raw(self):
+        data = [{"name": "caf\u00e9 \u2713"}]
+        for orjson_mod in (client.orjson, None):
+            with patch.object(client, "orjson", orjson_mod):
+                self.assertIn("caf\u00e9 \u2713".encode("utf-8"), client._json_bytes(data))
+                self.assertEqual(client._ndjson_bytes(data), '{"name":"caf\u00e9 \u2713"}\n'.encode("utf-8"))
+
     def test_output_creates_parent_dirs(self):
         with tempfile.TemporaryDirectory() as td:
             path = os.path.join(td, "sub", "dir", "out.json")
@@ -128,8 +224,9 @@ class TestRequestWithRetry(unittest.TestCase):
     """_request_with_retry retries on transient errors."""
 
     @patch("ado.client.time.sleep")
-    @patch("ado.client.requests.get")
-    def test_success_on_first_try(self, mock_get, mock_sleep):
+    @patch("ado.client._get_session")
+    def test_success_on_first_try(self, mock_session, mock_sleep):
+        mock_get = mock_session.return_value.get
         resp = MagicMock()
         resp.status_code = 200
         resp.raise_for_status = MagicMock()
@@ -140,8 +237,9 @@ class TestRequestWithRetry(unittest.TestCase):
         mock_sleep.assert_not_called()
 
     @patch("ado.client.time.sleep")
-    @patch("ado.client.requests.get")
-    def test_retry_on_429(self, mock_get, mock_sleep):
+    @patch("ado.client._get_session")
+    def test_retry_on_429(self, mock_session, mock_sleep):
+        mock_get = mock_session.return_value.get
         resp_429 = MagicMock()
         resp_429.status_code = 429
         resp_429.raise_for_status = MagicMock()
@@ -156,8 +254,48 @@ class TestRequestWithRetry(unittest.TestCase):
         self.assertEqual(mock_get.call_count, 2)
 
     @patch("ado.client.time.sleep")
-    @patch("ado.client.requests.get")
-    def test_retry_on_503(self, mock_get, mock_sleep):
+    @patch("ado.client._get_session")
+    def test_429_honours_retry_after(self, mock_session, mock_sleep):
+        mock_get = mock_session.return_value.get
+        resp_429 = MagicMock()
+        resp_429.status_code = 429
+        resp_429.headers = {"Retry-After": "30"}
+
+        resp_ok = MagicMock()
+        resp_ok.status_code = 200
+
+        mock_get.side_effect = [resp_429, resp_ok]
+        client._request_with_retry("GET", "http://example.com", headers={})
+        mock_sleep.assert_called_once_with(30.0)
+
+    @patch("ado.client.random.uniform", side_effect=lambda lo, hi: hi)
+    def test_retry_wait_bounds(self, mock_uniform):
+        resp = MagicMock()
+        resp.headers = {"Retry-After": "0"}
+        self.assertEqual(client.retry_wait(resp, 1), client._RETRY_BACKOFF * 2 * 1.5)
+        resp.headers = {"Retry-After": "3600"}
+        self.assertEqual(client.retry_wait(resp, 0), client._MAX_RETRY_AFTER)
+        resp.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        self.assertEqual(client.retry_wait(resp, 0), client._RETRY_BACKOFF * 1.5)
+        self.assertEqual(client.retry_wait(None, 0), client._RETRY_BACKOFF * 1.5)
+
+    @patch("ado.client.random.uniform", side_effect=lambda lo, hi: lo)
+    def test_retry_wait_http_date(self, mock_uniform):
+        from email.utils import formatdate
+        resp = MagicMock()
+        resp.headers = {"Retry-After": formatdate(time.time() + 20, usegmt=True)}
+        self.assertAlmostEqual(client.retry_wait(resp, 0), 20, delta=1.5)
+
+    def test_retry_wait_jitter_range(self):
+        waits = {client.retry_wait(None, 1) for _ in range(50)}
+        base = client._RETRY_BACKOFF * 2
+        self.assertTrue(all(base <= w <= base * (1 + client._RETRY_JITTER) for w in waits))
+        self.assertGreater(len(waits), 1)
+
+    @patch("ado.client.time.sleep")
+    @patch("ado.client._get_session")
+    def test_retry_on_503(self, mock_session, mock_sleep):
+        mock_get = mock_session.return_value.get
         resp_503 = MagicMock()
         resp_503.status_code = 503
 
@@ -168,10 +306,24 @@ class TestRequestWithRetry(unittest.TestCase):
         mock_get.side_effect = [resp_503, resp_ok]
         result = client._request_with_retry("GET", "http://example.com", headers={})
         self.assertEqual(result, resp_ok)
+        resp_503.close.assert_called_once()
+        resp_ok.close.assert_not_called()
+
+    @patch("ado.client._get_session")
+    def test_error_response_closed_before_raising(self, mock_session):
+        import requests as req
+        resp_404 = MagicMock()
+        resp_404.status_code = 404
+        resp_404.raise_for_status.side_effect = req.HTTPError("404 Not Found")
+        mock_session.return_value.get.return_value = resp_404
+        with self.assertRaises(req.HTTPError):
+            client._request_with_retry("GET", "http://example.com", headers={}, stream=True)
+        self.assertEqual([c[0] for c in resp_404.method_calls], ["close", "raise_for_status"])
 
     @patch("ado.client.time.sleep")
-    @patch("ado.client.requests.get")
-    def test_retry_on_timeout(self, mock_get, mock_sleep):
+    @patch("ado.client._get_session")
+    def test_retry_on_timeout(self, mock_session, mock_sleep):
+        mock_get = mock_session.return_value.get
         import requests as req
         resp_ok = MagicMock()
         resp_ok.status_code = 200
@@ -182,8 +334,9 @@ class TestRequestWithRetry(unittest.TestCase):
         self.assertEqual(result, resp_ok)
 
     @patch("ado.client.time.sleep")
-    @patch("ado.client.requests.post")
-    def test_post_method(self, mock_post, mock_sleep):
+    @patch("ado.client._get_session")
+    def test_post_method(self, mock_session, mock_sleep):
+        mock_post = mock_session.return_value.post
         resp = MagicMock()
         resp.status_code = 200
         resp.raise_for_status = MagicMock()
@@ -197,6 +350,99 @@ class TestRequestWithRetry(unittest.TestCase):
         mock_post.assert_called_once()
 
 
+class TestSession(unittest.TestCase):
+    """_get_session reuses one pooled session until closed."""
+
+    def tearDown(self):
+        client.close_session()
+
+    def test_session_is_reused(self):
+        self.assertIs(client._get_session(), client._get_session())
+
+    def test_session_scope_closes(self):
+        with client.session_scope() as s:
+            self.assertIs(s, client._get_session())
+        self.assertIsNone(client._session)
+
+    def test_advertises_compression(self):
+        self.assertIn("gzip", client._get_session().headers["Accept-Encoding"])
+
+    def test_adapter_pool_size(self):
+        adapter = client._get_session().get_adapter("https://dev.azure.com")
+        self.assertEqual(adapter._pool_maxsize, client._POOL_MAXSIZE)
+
+
+class TestGetStream(unittest.TestCase):
+    """get_stream requests eagerly and yields body chunks lazily."""
+
+    @patch("ado.client._headers", return_value={"Authorization": "Bearer fake"})
+    @patch("ado.client._request_with_retry")
+    def test_streams_chunks(self, mock_req, mock_headers):
+        client.set_org("myorg")
+        resp = MagicMock()
+        resp.iter_content.return_value = iter([b"a", b"b"])
+        mock_req.return_value = resp
+
+        chunks = client.get_stream("_apis/build/builds/1/logs/2", project="P")
+        self.assertTrue(mock_req.call_args[1]["stream"])
+        self.assertEqual(list(chunks), [b"a", b"b"])
+        resp.close.assert_called_once()
+
+
+class TestGather(unittest.TestCase):
+    """gather runs callables and preserves order."""
+
+    def test_results_in_order(self):
+        self.assertEqual(client.gather(lambda: 1, lambda: 2, lambda: 3), [1, 2, 3])
+
+    def test_propagates_exception(self):
+        def boom():
+            raise ValueError("boom")
+        with self.assertRaises(ValueError):
+            client.gather(lambda: 1, boom)
+
+    def test_return_errors(self):
+        def boom():
+            raise ValueError("boom")
+        self.assertEqual(
+            client.gather(lambda: 1, boom, return_errors=True),
+            [1, {"error": "ValueError: boom"}],
+        )
+        self.assertEqual(client.gather(boom, return_errors=True), [{"error": "ValueError: boom"}])
+
+
+class TestPostContentType(unittest.TestCase):
+    """POST callers must send Content-Type: application/json with the body."""
+
+    def _resp(self, data, headers=None):
+        resp = MagicMock()
+        resp.headers = {"Content-Type": "application/json", **(headers or {})}
+        resp.content = json.dumps(data).encode()
+        return resp
+
+    @patch("ado.client._headers", return_value={"Authorization": "Bearer fake"})
+    @patch("ado.client._request_with_retry")
+    def test_post_sets_content_type(self, mock_req, mock_headers):
+        client.set_org("myorg")
+        mock_req.return_value = self._resp({"value": []})
+        client.post("_apis/wit/workitemsbatch", json_body={"ids": [1]})
+        self.assertEqual(mock_req.call_args[1]["headers"]["Content-Type"], "application/json")
+        self.assertEqual(mock_req.call_args[1]["json_body"], {"ids": [1]})
+
+    @patch("ado.client._headers", return_value={"Authorization": "Bearer fake"})
+    @patch("ado.client._request_with_retry")
+    def test_paged_post_sets_content_type(self, mock_req, mock_headers):
+        client.set_org("myorg")
+        mock_req.side_effect = [
+            self._resp({"value": [1]}, {"x-ms-continuationtoken": "t"}),
+            self._resp({"value": [2]}),
+        ]
+        self.assertEqual(client.get_all("_apis/wiki/wikis/w/pagesbatch", json_body={"top": 1}), [1, 2])
+        for call in mock_req.call_args_list:
+            self.assertEqual(call[0][0], "POST")
+            self.assertEqual(call[1]["headers"]["Content-Type"], "application/json")
+
+
 class TestGetAll(unittest.TestCase):
     """get_all paginates using continuationToken."""
 
@@ -207,7 +453,7 @@ class TestGetAll(unittest.TestCase):
 
         resp = MagicMock()
         resp.headers = {"Content-Type": "application/json"}
-        resp.json.return_value = {"value": [{"id": 1}, {"id": 2}]}
+        resp.content = json.dumps({"value": [{"id": 1}, {"id": 2}]}).encode()
         mock_req.return_value = resp
 
         items = client.get_all("_apis/projects")
@@ -221,17 +467,79 @@ class TestGetAll(unittest.TestCase):
 
         resp1 = MagicMock()
         resp1.headers = {"Content-Type": "application/json"}
-        resp1.json.return_value = {"value": [{"id": 1}], "continuationToken": "abc"}
+        resp1.content = json.dumps({"value": [{"id": 1}], "continuationToken": "abc"}).encode()
 
         resp2 = MagicMock()
         resp2.headers = {"Content-Type": "application/json"}
-        resp2.json.return_value = {"value": [{"id": 2}]}
+        resp2.content = json.dumps({"value": [{"id": 2}]}).encode()
 
         mock_req.side_effect = [resp1, resp2]
         items = client.get_all("_apis/projects")
         self.assertEqual(len(items), 2)
         self.assertEqual(mock_req.call_count, 2)
 
+    @patch("ado.client._headers", return_value={"Authorization": "Bearer fake"})
+    @patch("ado.client._request_with_retry")
+    def test_limit_stops_paging(self, mock_req, mock_headers):
+        client.set_org("myorg")
+
+        resp = MagicMock()
+        resp.headers = {"Content-Type": "application/json"}
+        resp.content = json.dumps({"value": [{"id": 1}, {"id": 2}, {"id": 3}], "continuationToken": "abc"}).encode()
+        mock_req.return_value = resp
+
+        items = client.get_all("_apis/projects", params={"$top": 2}, limit=2)
+        self.assertEqual(items, [{"id": 1}, {"id": 2}])
+        self.assertEqual(mock_req.call_count, 1)
+
+    @patch("ado.client._headers", return_value={"Authorization": "Bearer fake"})
+    @patch("ado.client._request_with_retry")
+    def test_prefetches_next_page(self, mock_req, mock_headers):
+        client.set_org("myorg")
+
+        resp1 = MagicMock()
+        resp1.headers = {"Content-Type": "application/json"}
+        resp1.content = json.dumps({"value": [{"id": 1}], "continuationToken": "abc"}).encode()
+        resp2 = MagicMock()
+        resp2.headers = {"Content-Type": "application/json"}
+        resp2.content = json.dumps({"value": [{"id": 2}]}).encode()
+        mock_req.side_effect = [resp1, resp2]
+
+        it = client.iter_all("_apis/projects")
+        self.assertEqual(next(it), {"id": 1})
+        # Page 2 was requested before page 1's items were handed out
+        self.assertEqual(list(it), [{"id": 2}])
+        self.assertEqual(mock_req.call_count, 2)
+        self.assertEqual(mock_req.call_args_list[1][1]["params"]["continuationToken"], "abc")
+
+    @patch("ado.client._headers", return_value={"Authorization": "Bearer fake"})
+    @patch("ado.client._request_with_retry")
+    def test_continuation_token_from_header(self, mock_req, mock_headers):
+        client.set_org("myorg")
+
+        resp1 = MagicMock()
+        resp1.headers = {"Content-Type": "application/json", "x-ms-continuationtoken": "next"}
+        resp1.content = json.dumps({"value": [{"id": 1}]}).encode()
+        resp2 = MagicMock()
+        resp2.headers = {"Content-Type": "application/json"}
+        resp2.content = json.dumps({"value": [{"id": 2}]}).encode()
+        mock_req.side_effect = [resp1, resp2]
+
+        self.assertEqual(client.get_all("_apis/projects"), [{"id": 1}, {"id": 2}])
+        self.assertEqual(mock_req.call_args_list[1][1]["params"]["continuationToken"], "next")
+
+    @patch("ado.client._headers", return_value={"Authorization": "Bearer fake"})
+    @patch("ado.client._request_with_retry")
+    def test_no_prefetch_past_limit(self, mock_req, mock_headers):
+        client.set_org("myorg")
+
+        resp = MagicMock()
+        resp.headers = {"Content-Type": "application/json"}
+        resp.content = json.dumps({"value": [{"id": 1}, {"id": 2}], "continuationToken": "abc"}).encode()
+        mock_req.return_value = resp
+
+        self.assertEqual(client.get_all("_apis/projects", limit=2), [{"id": 1}, {"id": 2}])
+        self.assertEqual(mock_req.call_count, 1)
 
 if __name__ == "__main__":
     unittest.main()
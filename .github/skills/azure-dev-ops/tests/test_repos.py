@@ -7,7 +7,7 @@ import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 
-from ado import repos
+from ado import client, repos
 
 
 class TestGetPullRequestChanges(unittest.TestCase):
@@ -61,6 +61,9 @@ class TestGetPullRequestChanges(unittest.TestCase):
         mock_get.return_value = {"changeEntries": []}
         repos.get_pull_request_changes("proj", "repo", 1)
         self.assertIn("/iterations/5/changes", mock_get.call_args[0][0])
+        self.assertTrue(mock_get.call_args[1]["immutable"])
+        # The latest-iteration lookup is briefly cached
+        self.assertEqual(mock_iters.call_args[1]["ttl"], repos._PR_TTL)
 
     @patch("ado.repos.get_pull_request_iterations")
     @patch("ado.repos.client.get")
@@ -69,6 +72,37 @@ class TestGetPullRequestChanges(unittest.TestCase):
         mock_get.return_value = {"changeEntries": []}
         repos.get_pull_request_changes("proj", "repo", 1)
         self.assertIn("/iterations/1/changes", mock_get.call_args[0][0])
+        # No iteration exists yet, so the response is not a fixed snapshot
+        self.assertFalse(mock_get.call_args[1]["immutable"])
+
+
+class TestGetDiff(unittest.TestCase):
+    """get_diff caches only commit-to-commit diffs."""
+
+    @patch("ado.repos.client.get")
+    def test_commit_diff_is_immutable(self, mock_get):
+        repos.get_diff("proj", "repo", base_version="abc", target_version="def")
+        self.assertTrue(mock_get.call_args[1]["immutable"])
+
+    @patch("ado.repos.client.get")
+    def test_branch_diff_is_not_cached(self, mock_get):
+        repos.get_diff("proj", "repo", base_version="main", target_version="abc", base_version_type="branch")
+        self.assertFalse(mock_get.call_args[1]["immutable"])
+        repos.get_diff("proj", "repo", target_version="abc")
+        self.assertFalse(mock_get.call_args[1]["immutable"])
+
+
+class TestClassifyChanges(unittest.TestCase):
+
+    def test_skips_missing_paths_and_other_types(self):
+        added, edited, deleted = repos._classify_changes([
+            {"changeType": "add", "item": {"path": "/a"}},
+            {"changeType": "rename", "item": {"path": "/r"}},
+            {"changeType": "edit", "item": None},
+            {"changeType": "delete"},
+            {"changeType": "edit", "item": {"path": "/e"}},
+        ])
+        self.assertEqual((added, edited, deleted), (["/a"], ["/e"], []))
 
 
 class TestPrSummary(unittest.TestCase):
@@ -150,6 +184,68 @@ class TestPrSummary(unittest.TestCase):
         self.assertEqual(result["createdBy"], "Alice")
 
 
+class TestPrSummaryConcurrency(unittest.TestCase):
+    """pr_summary issues its three sub-queries concurrently."""
+
+    @patch("ado.repos.list_pr_threads")
+    @patch("ado.repos.get_pull_request_changes")
+    @patch("ado.repos.get_pull_request")
+    def test_sub_queries_overlap(self, mock_pr, mock_changes, mock_threads):
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_then(value):
+            def _call(*args, **kwargs):
+                barrier.wait()  # deadlocks (then times out) if run sequentially
+                return value
+            return _call
+
+        mock_pr.side_effect = wait_then({"title": "T"})
+        mock_changes.side_effect = wait_then([])
+        mock_threads.side_effect = wait_then([])
+        result = repos.pr_summary("proj", "repo", 1)
+        self.assertEqual(result["title"], "T")
+
+
+class TestPrSummaries(unittest.TestCase):
+
+    @patch("ado.repos.pr_summary")
+    def test_keyed_in_input_order_with_errors(self, mock_summary):
+        def summarise(project, repo, pr_id):
+            if pr_id == 2:
+                raise RuntimeError("boom")
+            return {"title": f"PR {pr_id}"}
+
+        mock_summary.side_effect = summarise
+        result = repos.pr_summaries("proj", "repo", [3, 2, 1])
+        self.assertEqual(list(result), [3, 2, 1])
+        self.assertEqual(result[3], {"title": "PR 3"})
+        self.assertEqual(result[2], {"error": "RuntimeError: boom"})
+
+    @patch("ado.repos.pr_summary")
+    def test_runs_concurrently(self, mock_summary):
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+
+        def summarise(project, repo, pr_id):
+            barrier.wait()  # times out if run sequentially
+            return {"id": pr_id}
+
+        mock_summary.side_effect = summarise
+        result = repos.pr_summaries("proj", "repo", [1, 2, 3])
+        self.assertEqual(result[2], {"id": 2})
+
+    @patch("ado.repos.pr_summary")
+    def test_org_scope_reaches_workers(self, mock_summary):
+        mock_summary.side_effect = lambda project, repo, pr_id: {"org": client._org()}
+        with client.org_scope("other"):
+            result = repos.pr_summaries("proj", "repo", [1, 2])
+        self.assertEqual(result[2], {"org": "https://dev.azure.com/other"})
+
+    def test_empty(self):
+        self.assertEqual(repos.pr_summaries("proj", "repo", []), {})
+
+
 class TestPrDownload(unittest.TestCase):
     """pr_download calls bulk_download_files correctly."""
 
@@ -171,22 +267,42 @@ class TestPrDownload(unittest.TestCase):
         with tempfile.TemporaryDirectory() as td:
             result = repos.pr_download("proj", "repo", 1, td)
 
+        # Both sides download concurrently; tell the calls apart by output dir
+        # (3rd positional arg = paths, 4th = output dir)
+        calls = {os.path.basename(c[0][3]): c for c in mock_bulk.call_args_list}
+
         # Target (before) should download edited + deleted
-        target_call = mock_bulk.call_args_list[0]
-        target_paths = target_call[0][2]  # 3rd positional arg = paths
+        target_call = calls["target"]
+        target_paths = target_call[0][2]
+        self.assertEqual(target_call[1]["commit"], "tgt456")
         self.assertIn("/src/Changed.cs", target_paths)
         self.assertIn("/src/Gone.cs", target_paths)
         self.assertNotIn("/src/New.cs", target_paths)
 
         # Source (after) should download edited + added
-        source_call = mock_bulk.call_args_list[1]
+        source_call = calls["source"]
         source_paths = source_call[0][2]
+        self.assertEqual(source_call[1]["commit"], "src123")
         self.assertIn("/src/Changed.cs", source_paths)
         self.assertIn("/src/New.cs", source_paths)
         self.assertNotIn("/src/Gone.cs", source_paths)
 
+    @patch("ado.repos.bulk_download_files")
+    @patch("ado.repos.get_pull_request_changes", return_value=[{"changeType": "rename", "item": {"path": "/x"}}])
     @patch("ado.repos.get_pull_request")
-    def test_raises_if_no_merge_commits(self, mock_pr):
+    def test_no_files_skips_downloads(self, mock_pr, mock_changes, mock_bulk):
+        mock_pr.return_value = {
+            "lastMergeSourceCommit": {"commitId": "src"},
+            "lastMergeTargetCommit": {"commitId": "tgt"},
+        }
+        result = repos.pr_download("proj", "repo", 1, "/tmp/unused")
+        mock_bulk.assert_not_called()
+        self.assertEqual(result["downloads"], {"target": [], "source": []})
+        self.assertEqual(result["sourceCommit"], "src")
+
+    @patch("ado.repos.get_pull_request_changes", return_value=[])
+    @patch("ado.repos.get_pull_request")
+    def test_raises_if_no_merge_commits(self, mock_pr, mock_changes):
         mock_pr.return_value = {
             "lastMergeSourceCommit": None,
             "lastMergeTargetCommit": None,
@@ -199,9 +315,9 @@ class TestBulkDownloadFiles(unittest.TestCase):
     """bulk_download_files writes files to disk."""
 
     @patch("ado.repos.time.sleep")
-    @patch("ado.repos.get_file_content")
+    @patch("ado.repos.iter_file_content")
     def test_downloads_to_correct_paths(self, mock_content, mock_sleep):
-        mock_content.return_value = "file content"
+        mock_content.return_value = [b"file content"]
         with tempfile.TemporaryDirectory() as td:
             results = repos.bulk_download_files(
                 "proj", "repo",
@@ -215,9 +331,9 @@ class TestBulkDownloadFiles(unittest.TestCase):
             self.assertTrue(os.path.exists(os.path.join(td, "src", "sub", "B.cs")))
 
     @patch("ado.repos.time.sleep")
-    @patch("ado.repos.get_file_content")
+    @patch("ado.repos.iter_file_content")
     def test_retries_on_failure(self, mock_content, mock_sleep):
-        mock_content.side_effect = [Exception("network error"), "content"]
+        mock_content.side_effect = [Exception("network error"), [b"content"]]
         with tempfile.TemporaryDirectory() as td:
             results = repos.bulk_download_files(
                 "proj", "repo", ["/x.cs"], td, retries=1,
@@ -226,7 +342,52 @@ class TestBulkDownloadFiles(unittest.TestCase):
             self.assertEqual(mock_content.call_count, 2)
 
     @patch("ado.repos.time.sleep")
-    @patch("ado.repos.get_file_content")
+    @patch("ado.repos.iter_file_content")
+    def test_retry_honours_retry_after(self, mock_content, mock_sleep):
+        import requests
+        resp = MagicMock()
+        resp.headers = {"Retry-After": "30"}
+        mock_content.side_effect = [requests.HTTPError("429", response=resp), [b"content"]]
+        with tempfile.TemporaryDirectory() as td:
+            repos.bulk_download_files("proj", "repo", ["/x.cs"], td, retries=1)
+        mock_sleep.assert_called_once_with(30.0)
+
+    @patch("ado.repos.time.sleep")
+    @patch("ado.repos.iter_file_content")
+    def test_failed_download_leaves_no_partial_file(self, mock_content, mock_sleep):
+        def broken_stream():
+            yield b"half"
+            raise OSError("connection reset")
+
+        mock_content.side_effect = [broken_stream(), OSError("503")]
+        with tempfile.TemporaryDirectory() as td:
+            results = repos.bulk_download_files("proj", "repo", ["/a.cs"], td, retries=1)
+            self.assertEqual(results[0]["status"], "failed")
+            self.assertEqual(os.listdir(td), [])
+
+    @patch("ado.repos.iter_file_content")
+    def test_repeated_path_downloaded_once(self, mock_content):
+        mock_content.side_effect = lambda *a, **k: iter([b"x"])
+        with tempfile.TemporaryDirectory() as td:
+            results = repos.bulk_download_files("proj", "repo", ["/a.cs", "/b.cs", "/a.cs"], td)
+        self.assertEqual([r["path"] for r in results], ["/a.cs", "/b.cs"])
+        self.assertEqual(mock_content.call_count, 2)
+
+    @patch("ado.repos.time.sleep")
+    @patch("ado.repos.iter_file_content")
+    def test_not_found_is_not_retried(self, mock_content, mock_sleep):
+        import requests
+        resp = MagicMock()
+        resp.status_code = 404
+        mock_content.side_effect = requests.HTTPError("404", response=resp)
+        with tempfile.TemporaryDirectory() as td:
+            results = repos.bulk_download_files("proj", "repo", ["/gone.cs"], td, retries=2)
+        self.assertEqual(results[0]["status"], "failed")
+        self.assertEqual(mock_content.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch("ado.repos.time.sleep")
+    @patch("ado.repos.iter_file_content")
     def test_failure_after_exhausted_retries(self, mock_content, mock_sleep):
         mock_content.side_effect = Exception("permanent error")
         with tempfile.TemporaryDirectory() as td:
@@ -236,6 +397,68 @@ class TestBulkDownloadFiles(unittest.TestCase):
             self.assertEqual(results[0]["status"], "failed")
             self.assertIn("permanent error", results[0]["error"])
 
+    @patch("ado.repos.time.sleep")
+    @patch("ado.repos.iter_file_content")
+    def test_results_keep_input_order(self, mock_content, mock_sleep):
+        mock_content.side_effect = lambda project, repo, path, **kw: [f"content of {path}".encode()]
+        paths = [f"/src/F{i}.cs" for i in range(20)]
+        with tempfile.TemporaryDirectory() as td:
+            results = repos.bulk_download_files("proj", "repo", paths, td)
+            self.assertEqual([r["path"] for r in results], paths)
+            with open(os.path.join(td, "src", "F7.cs")) as f:
+                self.assertEqual(f.read(), "content of /src/F7.cs")
+
+    @patch("ado.repos.time.sleep")
+    @patch("ado.repos.iter_file_content")
+    def test_writes_bytes_unchanged(self, mock_content, mock_sleep):
+        mock_content.return_value = iter([b"line1\r\n", b"caf\xc3\xa9\n"])
+        with tempfile.TemporaryDirectory() as td:
+            repos.bulk_download_files("proj", "repo", ["/a.txt"], td, branch="main")
+            with open(os.path.join(td, "a.txt"), "rb") as f:
+                self.assertEqual(f.read(), b"line1\r\ncaf\xc3\xa9\n")
+
+    @patch("ado.repos.time.sleep")
+    @patch("ado.repos.iter_file_content")
+    def test_progress_is_throttled(self, mock_content, mock_sleep):
+        import contextlib
+        import io
+
+        def content(project, repo, path, **kwargs):
+            if path == "/f7":
+                raise OSError("nope")
+            return [b"x"]
+
+        mock_content.side_effect = content
+        err = io.StringIO()
+        with tempfile.TemporaryDirectory() as td, contextlib.redirect_stderr(err):
+            repos.bulk_download_files("proj", "repo", [f"/f{i}" for i in range(100)], td, retries=0)
+        lines = err.getvalue().splitlines()
+        # Every 5th completion (5% of 100) plus the failure, unless it
+        # happened to complete on a reporting step
+        self.assertIn(len(lines), (20, 21))
+        self.assertEqual(sum("failed: /f7" in line for line in lines), 1)
+
+    @patch("ado.repos.iter_file_content")
+    def test_empty_paths(self, mock_content):
+        self.assertEqual(repos.bulk_download_files("proj", "repo", [], "/tmp/unused"), [])
+        mock_content.assert_not_called()
+
+
+class TestListRepos(unittest.TestCase):
+    """list_repos filters and truncates client-side."""
+
+    @patch("ado.repos.client.get_all")
+    def test_name_filter_and_top(self, mock_all):
+        mock_all.return_value = [{"name": "Alpha-API"}, {"name": "beta"}, {"name": "api-docs"}, {"name": "web-api"}]
+        result = repos.list_repos("proj", name_filter="API", top=2)
+        self.assertEqual([r["name"] for r in result], ["Alpha-API", "api-docs"])
+        self.assertNotIn("params", mock_all.call_args[1])
+
+    @patch("ado.repos.client.get_all")
+    def test_no_filter(self, mock_all):
+        mock_all.return_value = [{"name": "a"}, {"name": "b"}]
+        self.assertEqual(len(repos.list_repos("proj")), 2)
+
 
 class TestListBranches(unittest.TestCase):
     """list_branches unwraps value key."""
@@ -264,16 +487,30 @@ class TestGetPullRequest(unittest.TestCase):
         self.assertEqual(result["pullRequestId"], 1)
         self.assertNotIn("workItemRefs", result)
         mock_get.assert_called_once()
+        self.assertIsNone(mock_get.call_args[1]["ttl"])
 
     @patch("ado.repos.client.get")
     def test_with_work_items(self, mock_get):
-        mock_get.side_effect = [
-            {"pullRequestId": 1, "title": "PR"},
-            {"value": [{"id": 42}]},
-        ]
-        result = repos.get_pull_request("proj", "repo", 1, include_work_items=True)
+        # Both requests run concurrently, so answer by path rather than order
+        mock_get.side_effect = lambda path, **kw: (
+            {"value": [{"id": 42}]} if path.endswith("/workitems") else {"pullRequestId": 1, "title": "PR"}
+        )
+        result = repos.get_pull_request("proj", "repo", 1, include_work_items=True, ttl=30)
         self.assertEqual(result["workItemRefs"], [{"id": 42}])
         self.assertEqual(mock_get.call_count, 2)
+        self.assertTrue(all(c[1]["ttl"] == 30 for c in mock_get.call_args_list))
+
+    @patch("ado.repos.work_items.get_work_items_batch")
+    @patch("ado.repos.client.get")
+    def test_expand_work_items_batches(self, mock_get, mock_batch):
+        mock_get.side_effect = lambda path, **kw: (
+            {"value": [{"id": "42"}, {"id": "7"}]} if path.endswith("/workitems") else {"pullRequestId": 1}
+        )
+        mock_batch.return_value = [{"id": 42}, {"id": 7}]
+        result = repos.get_pull_request("proj", "repo", 1, expand_work_items=True)
+        mock_batch.assert_called_once_with("proj", [42, 7])
+        self.assertEqual(result["workItems"], [{"id": 42}, {"id": 7}])
+        self.assertEqual(len(result["workItemRefs"]), 2)
 
 
 class TestGetFileContent(unittest.TestCase):
@@ -303,5 +540,22 @@ class TestGetFileContent(unittest.TestCase):
         self.assertNotIn("versionDescriptor.version", params)
 
 
+class TestIterFileContent(unittest.TestCase):
+    """iter_file_content streams every read and caches commit-pinned ones."""
+
+    @patch("ado.repos.client.get_stream")
+    def test_branch_streams(self, mock_stream):
+        mock_stream.return_value = iter([b"a", b"b"])
+        chunks = repos.iter_file_content("proj", "repo", "/src/A.cs", branch="main")
+        self.assertEqual(list(chunks), [b"a", b"b"])
+        self.assertEqual(mock_stream.call_args[1]["params"]["versionDescriptor.versionType"], "branch")
+        self.assertFalse(mock_stream.call_args[1]["immutable"])
+
+    @patch("ado.repos.client.get_stream")
+    def test_commit_is_cached(self, mock_stream):
+        repos.iter_file_content("proj", "repo", "/src/A.cs", commit="abc123")
+        self.assertTrue(mock_stream.call_args[1]["immutable"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,41 @@
+"""Tests for ado/test_plans.py — per-build result collection."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from ado import test_plans
+
+
+class TestGetTestResultsByBuild(unittest.TestCase):
+    """get_test_results_by_build fetches each run's results and tags them."""
+
+    @patch("ado.test_plans.client.get")
+    def test_results_in_run_order(self, mock_get):
+        def get(path, **kwargs):
+            if path == "_apis/test/runs":
+                return {"value": [{"id": 1, "name": "unit"}, {"id": 2, "name": "e2e"}]}
+            run_id = path.split("/")[3]
+            return {"value": [{"testCaseTitle": f"case-{run_id}"}]}
+
+        mock_get.side_effect = get
+        results = test_plans.get_test_results_by_build("P", 42)
+        self.assertEqual(
+            [(r["testCaseTitle"], r["runName"]) for r in results],
+            [("case-1", "unit"), ("case-2", "e2e")],
+        )
+        self.assertEqual(
+            mock_get.call_args_list[0][1]["params"],
+            {"buildUri": "vstfs:///Build/Build/42"},
+        )
+
+    @patch("ado.test_plans.client.get")
+    def test_no_runs(self, mock_get):
+        mock_get.return_value = {"value": []}
+        self.assertEqual(test_plans.get_test_results_by_build("P", 42), [])
+        mock_get.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
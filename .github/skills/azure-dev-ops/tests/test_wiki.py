@@ -0,0 +1,85 @@
+"""Tests for ado/wiki.py — page listing and multi-page content retrieval."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ado import client, wiki
+
+
+class TestGetPagesContent(unittest.TestCase):
+    """get_pages_content fetches each page and keys the text by path."""
+
+    @patch("ado.wiki.client.get_text")
+    def test_keyed_by_path(self, mock_text):
+        mock_text.side_effect = lambda path, *, project, params: f"# {params['path']}"
+        result = wiki.get_pages_content("P", "P.wiki", ["/B", "/A"])
+        self.assertEqual(result, {"/B": "# /B", "/A": "# /A"})
+        self.assertEqual(list(result), ["/B", "/A"])
+
+    @patch("ado.wiki.client.get_text")
+    def test_missing_page_does_not_fail_others(self, mock_text):
+        def get_text(path, *, project, params):
+            if params["path"] == "/Missing":
+                raise RuntimeError("404 Not Found")
+            return "text"
+
+        mock_text.side_effect = get_text
+        result = wiki.get_pages_content("P", "P.wiki", ["/A", "/Missing"])
+        self.assertEqual(result, {"/A": "text", "/Missing": {"error": "RuntimeError: 404 Not Found"}})
+
+    @patch("ado.wiki.client.get_text")
+    def test_empty(self, mock_text):
+        self.assertEqual(wiki.get_pages_content("P", "P.wiki", []), {})
+        mock_text.assert_not_called()
+
+
+
+class TestListPages(unittest.TestCase):
+    """list_pages POSTs pagesbatch and follows the header continuation token."""
+
+    @patch("ado.client._headers", return_value={"Authorization": "Bearer fake"})
+    @patch("ado.client._request_with_retry")
+    def test_follows_header_token(self, mock_req, mock_headers):
+        client.set_org("myorg")
+        resp1 = MagicMock()
+        resp1.headers = {"Content-Type": "application/json", "x-ms-continuationtoken": "next"}
+        resp1.content = json.dumps({"count": 1, "value": [{"path": "/A"}]}).encode()
+        resp2 = MagicMock()
+        resp2.headers = {"Content-Type": "application/json"}
+        resp2.content = json.dumps({"count": 1, "value": [{"path": "/B"}]}).encode()
+        mock_req.side_effect = [resp1, resp2]
+
+        pages = wiki.list_pages("P", "P.wiki", page_views_for_days=7)
+        self.assertEqual(pages, {"count": 2, "value": [{"path": "/A"}, {"path": "/B"}]})
+        first, second = mock_req.call_args_list
+        self.assertEqual(first[0][0], "POST")
+        self.assertEqual(first[1]["json_body"], {"top": 100, "pageViewsForDays": 7})
+        self.assertEqual(second[1]["json_body"]["continuationToken"], "next")
+
+    @patch("ado.client.iter_all")
+    def test_top_caps_request_and_total(self, mock_iter):
+        mock_iter.return_value = iter([])
+        wiki.list_pages("P", "P.wiki", top=20, continuation_token="abc")
+        kwargs = mock_iter.call_args[1]
+        self.assertEqual(kwargs["json_body"], {"top": 20, "continuationToken": "abc"})
+        self.assertEqual(kwargs["limit"], 20)
+
+    @patch("ado.client._headers", return_value={"Authorization": "Bearer fake"})
+    @patch("ado.client._request_with_retry")
+    def test_resume_with_top_is_one_request(self, mock_req, mock_headers):
+        client.set_org("myorg")
+        resp = MagicMock()
+        resp.headers = {"Content-Type": "application/json", "x-ms-continuationtoken": "next"}
+        resp.content = json.dumps({"count": 2, "value": [{"path": "/C"}, {"path": "/D"}]}).encode()
+        mock_req.return_value = resp
+
+        pages = wiki.list_pages("P", "P.wiki", top=2, continuation_token="abc")
+        self.assertEqual(pages["value"], [{"path": "/C"}, {"path": "/D"}])
+        mock_req.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""Tests for ado/work_items.py — batching and WIQL expansion."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from ado import work_items
+
+
+class TestGetWorkItemsBatch(unittest.TestCase):
+    """get_work_items_batch splits large ID lists into API-sized chunks."""
+
+    @patch("ado.work_items.client.post")
+    def test_single_chunk(self, mock_post):
+        mock_post.return_value = {"value": [{"id": 1}, {"id": 2}]}
+        result = work_items.get_work_items_batch("P", [1, 2], fields=["System.Title"])
+        self.assertEqual(result, [{"id": 1}, {"id": 2}])
+        body = mock_post.call_args[1]["json_body"]
+        self.assertEqual(body, {"ids": [1, 2], "fields": ["System.Title"]})
+
+    @patch("ado.work_items.client.post")
+    def test_empty_ids_skip_request(self, mock_post):
+        self.assertEqual(work_items.get_work_items_batch("P", []), [])
+        mock_post.assert_not_called()
+
+    @patch("ado.work_items.client.post")
+    def test_chunks_keep_order(self, mock_post):
+        mock_post.side_effect = lambda *a, json_body, **kw: {"value": [{"id": i} for i in json_body["ids"]]}
+        ids = list(range(1, 451))
+        result = work_items.get_work_items_batch("P", ids)
+        self.assertEqual([w["id"] for w in result], ids)
+        sizes = sorted(len(c[1]["json_body"]["ids"]) for c in mock_post.call_args_list)
+        self.assertEqual(sizes, [50, 200, 200])
+
+
+class TestExpandIds(unittest.TestCase):
+    """run_wiql / get_query_results can return full work items."""
+
+    _WIQL = {
+        "columns": [{"referenceName": "System.Id"}, {"referenceName": "System.Title"}],
+        "workItems": [{"id": 7, "url": "u7"}, {"id": 3, "url": "u3"}],
+    }
+
+    @patch("ado.work_items.get_work_items_batch", return_value=[{"id": 7}, {"id": 3}])
+    @patch("ado.work_items.client.post")
+    def test_run_wiql_expand(self, mock_post, mock_batch):
+        mock_post.return_value = self._WIQL
+        result = work_items.run_wiql("P", "SELECT ...", expand_ids=True)
+        mock_batch.assert_called_once_with("P", [7, 3], fields=["System.Id", "System.Title"])
+        self.assertEqual(result["workItems"], [{"id": 7}, {"id": 3}])
+        self.assertEqual(result["columns"], self._WIQL["columns"])
+
+    @patch("ado.work_items.get_work_items_batch")
+    @patch("ado.work_items.client.post")
+    def test_run_wiql_default_returns_refs(self, mock_post, mock_batch):
+        mock_post.return_value = self._WIQL
+        self.assertIs(work_items.run_wiql("P", "SELECT ..."), self._WIQL)
+        mock_batch.assert_not_called()
+
+    @patch("ado.work_items.get_work_items_batch")
+    @patch("ado.work_items.client.post")
+    def test_query_results_no_matches(self, mock_post, mock_batch):
+        mock_post.return_value = {"columns": [], "workItems": []}
+        result = work_items.get_query_results("qid", expand_ids=True)
+        self.assertEqual(result["workItems"], [])
+        mock_batch.assert_not_called()
+
+
+
+class TestGetWorkItemType(unittest.TestCase):
+
+    @patch("ado.work_items.client.get")
+    def test_served_with_ttl(self, mock_get):
+        mock_get.return_value = {"name": "Bug"}
+        self.assertEqual(work_items.get_work_item_type("P", "Bug"), {"name": "Bug"})
+        self.assertEqual(mock_get.call_args[1]["ttl"], work_items._METADATA_TTL)
+
+
+class TestMyWorkItems(unittest.TestCase):
+
+    @patch("ado.work_items.client.post")
+    def test_type_filter_is_escaped(self, mock_post):
+        mock_post.return_value = {"workItems": []}
+        work_items.my_work_items("P", type_filter="Bug' OR 'a'='a")
+        query = mock_post.call_args[1]["json_body"]["query"]
+        self.assertIn("[System.WorkItemType] = 'Bug'' OR ''a''=''a'", query)
+        self.assertIn("[System.State] <> 'Closed'", query)
+
+    @patch("ado.work_items.client.post")
+    def test_include_completed_without_type(self, mock_post):
+        mock_post.return_value = {"workItems": []}
+        work_items.my_work_items("P", include_completed=True)
+        query = mock_post.call_args[1]["json_body"]["query"]
+        self.assertEqual(
+            query,
+            "SELECT [System.Id] FROM WorkItems WHERE [System.AssignedTo] = @Me ORDER BY [System.ChangedDate] DESC",
+        )
+
+
+class TestPerItemMany(unittest.TestCase):
+    """*_many helpers fan out per work item and key results by ID."""
+
+    @patch("ado.work_items.client.get")
+    def test_comments_keyed_by_id(self, mock_get):
+        mock_get.side_effect = lambda path, **kw: {"comments": [{"text": path.split("/")[3]}]}
+        result = work_items.list_comments_many("P", [7, 3], top=5)
+        self.assertEqual(result, {7: [{"text": "7"}], 3: [{"text": "3"}]})
+        self.assertEqual(mock_get.call_args[1]["params"], {"$top": 5})
+
+    @patch("ado.work_items.client.get")
+    def test_revisions_keyed_by_id(self, mock_get):
+        mock_get.side_effect = lambda path, **kw: {"value": [{"rev": int(path.split("/")[3])}]}
+        result = work_items.list_revisions_many("P", [1, 2])
+        self.assertEqual(result, {1: [{"rev": 1}], 2: [{"rev": 2}]})
+
+    @patch("ado.work_items.client.get")
+    def test_failed_id_does_not_lose_others(self, mock_get):
+        def get(path, **kw):
+            if "/999/" in path:
+                raise RuntimeError("404 Not Found")
+            return {"comments": [{"text": "ok"}]}
+
+        mock_get.side_effect = get
+        result = work_items.list_comments_many("P", [1, 2, 999])
+        self.assertEqual(result[1], [{"text": "ok"}])
+        self.assertEqual(result[2], [{"text": "ok"}])
+        self.assertEqual(result[999], {"error": "RuntimeError: 404 Not Found"})
+
+    @patch("ado.work_items.client.gather")
+    def test_concurrency_is_capped(self, mock_gather):
+        mock_gather.return_value = [[]]
+        work_items.list_comments_many("P", [1])
+        self.assertEqual(mock_gather.call_args[1]["max_workers"], work_items._PER_ITEM_WORKERS)
+
+if __name__ == "__main__":
+    unittest.main()